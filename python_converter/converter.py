@@ -6,7 +6,12 @@ Usage: converter.exe <conversion_type> <input_file> <output_file>
 
 import sys
 import os
+import threading
 from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 import subprocess
 
 # Path to Ghostscript executable (bundled with app)
@@ -43,8 +48,275 @@ def get_ghostscript_path():
 
 GHOSTSCRIPT_PATH = get_ghostscript_path()
 
+# pdfplumber-compatible readers, fastest first
+PDF_BACKENDS = ('pdfplumber_rs', 'ripdoc', 'pdfplumber')
+
+@lru_cache(maxsize=None)
+def pdf_opener(backend):
+    """
+    The open function of the reader a UBPDF_PDF_BACKEND value selects
+    
+    Resolved once per process, so backends that aren't installed are only
+    searched for once rather than on every open.
+    """
+    for name in PDF_BACKENDS:
+        if backend != 'auto' and name != backend:
+            continue
+        try:
+            if name == 'pdfplumber_rs':
+                import pdfplumber_rs
+                open_pdf = pdfplumber_rs.PDF.open
+            elif name == 'ripdoc':
+                import ripdoc
+                open_pdf = ripdoc.open
+            else:
+                import pdfplumber
+                open_pdf = pdfplumber.open
+        except ImportError:
+            if backend != 'auto':
+                raise
+            continue
+        return open_pdf
+    
+    raise Exception("pdfplumber is not installed; run: pip install pdfplumber")
+
+def open_pdfplumber(source):
+    """
+    Open a PDF through pdfplumber or a Rust drop-in with the same API
+    
+    UBPDF_PDF_BACKEND selects 'pdfplumber_rs', 'ripdoc' or 'pdfplumber';
+    unset (or 'auto') uses the first of those that is installed.
+    """
+    backend = os.environ.get('UBPDF_PDF_BACKEND', 'auto').strip().lower() or 'auto'
+    if backend != 'auto' and backend not in PDF_BACKENDS:
+        raise Exception(f"Unknown UBPDF_PDF_BACKEND: {backend} (use one of: auto, {', '.join(PDF_BACKENDS)})")
+    
+    return pdf_opener(backend)(source)
+
+# Parsed pdfplumber handles by (path, backend), least recently used first
+SHARED_PDFS = OrderedDict()
+SHARED_PDFS_MAX = 4
+SHARED_PDFS_LOCK = threading.Lock()
+
+def shared_pdf(input_path):
+    """
+    pdfplumber handle shared by every conversion of the same unchanged file
+    
+    The handle is owned by the cache: callers must not close it. At most
+    SHARED_PDFS_MAX files are held open; the least recently used handle is
+    closed to make room, and a changed file's old handle is closed on reopen.
+    """
+    path = os.path.abspath(input_path)
+    stat = os.stat(path)
+    key = (path, os.environ.get('UBPDF_PDF_BACKEND', 'auto'))
+    version = (stat.st_mtime_ns, stat.st_size)
+    
+    with SHARED_PDFS_LOCK:
+        entry = SHARED_PDFS.pop(key, None)
+        if entry is not None and entry[0] != version:
+            entry[1].close()
+            entry = None
+        if entry is None:
+            entry = (version, open_pdfplumber(path))
+            while len(SHARED_PDFS) >= SHARED_PDFS_MAX:
+                SHARED_PDFS.popitem(last=False)[1][1].close()
+        SHARED_PDFS[key] = entry
+        return entry[1]
+
+def close_shared_pdfs():
+    """Close every cached handle, releasing the files (Windows locks open files)"""
+    with SHARED_PDFS_LOCK:
+        while SHARED_PDFS:
+            SHARED_PDFS.popitem()[1][1].close()
+
+# Per-process pdfplumber handle for map_pdf_pages workers
+page_worker_pdf = None
+
+def init_page_worker(input_path):
+    """Open the PDF once per worker process"""
+    global page_worker_pdf
+    page_worker_pdf = open_pdfplumber(input_path)
+
+def run_page(page_func, page, page_num):
+    """page_func(page, page_num), then drop the page's parsed objects so memory stays one page deep"""
+    result = page_func(page, page_num)
+    flush_cache = getattr(page, 'flush_cache', None)  # Not every drop-in backend has it
+    if flush_cache is not None:
+        flush_cache()
+    return result
+
+def run_page_worker(page_func, page_num):
+    """Worker entry point: apply page_func to one page of this process's PDF"""
+    return run_page(page_func, page_worker_pdf.pages[page_num], page_num)
+
+# Set in --batch worker processes, which already run one file per core
+IN_BATCH_WORKER = False
+
+def map_pdf_pages(input_path, page_func):
+    """
+    Yield page_func(page, page_num) for every page, in page order
+    
+    page_func must be a module-level function so it can be sent to worker
+    processes; its result is what crosses back, so keep it plain data.
+    """
+    pdf = shared_pdf(input_path)
+    page_count = len(pdf.pages)
+    if page_count < 4 or IN_BATCH_WORKER:
+        # Too few pages to repay worker start-up, or --batch already has every core busy
+        for page_num, page in enumerate(pdf.pages):
+            yield run_page(page_func, page, page_num)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    max_workers = min(os.cpu_count() or 1, page_count)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_page_worker,
+                             initargs=(input_path,)) as executor:
+        yield from executor.map(run_page_worker, [page_func] * page_count, range(page_count), chunksize=4)
+
+# Ruled-table detection from drawn lines only, spelled out so that a change of library
+# defaults can't switch the converters to the much slower text-based inference.
+# PyMuPDF's find_tables and pdfplumber's extract_tables both take these keys.
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 3,
+    "min_words_vertical": 3,
+    "min_words_horizontal": 1,
+    "intersection_tolerance": 3,
+}
+
+def page_tables(page, page_num):
+    """map_pdf_pages worker: tables on one page"""
+    return page.extract_tables(TABLE_SETTINGS)
+
+# Shared reportlab stylesheet, built on first use; callers must not modify it
+STYLES = None
+STYLES_LOCK = threading.Lock()
+
+def get_styles():
+    """Sample stylesheet plus the custom styles used by the converters, built once per process"""
+    global STYLES
+    with STYLES_LOCK:
+        if STYLES is None:
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+            from reportlab.lib import colors
+            
+            styles = getSampleStyleSheet()
+            
+            # word_to_pdf headings
+            font_sizes = {1: 18, 2: 16, 3: 14, 4: 12, 5: 11, 6: 10}
+            for i in range(1, 7):
+                styles.add(ParagraphStyle(
+                    name=f'CustomHeading{i}',
+                    parent=styles['Heading1'],
+                    fontSize=font_sizes[i],
+                    fontName='Helvetica-Bold',
+                    spaceAfter=12,
+                    spaceBefore=6,
+                    textColor=colors.HexColor('#2E4053')
+                ))
+            
+            # html_to_pdf headings
+            font_sizes = {1: 20, 2: 16, 3: 14, 4: 12, 5: 11, 6: 10}
+            for i in range(1, 7):
+                styles.add(ParagraphStyle(
+                    name=f'CustomH{i}',
+                    parent=styles['Heading1'],
+                    fontSize=font_sizes[i],
+                    fontName='Helvetica-Bold',
+                    spaceAfter=12,
+                    spaceBefore=6,
+                    textColor=colors.HexColor('#2C3E50')
+                ))
+            
+            # Alignment variants for word_to_pdf and html_to_pdf
+            for align_name, align_val in [('Left', TA_LEFT), ('Center', TA_CENTER), ('Right', TA_RIGHT), ('Justify', TA_JUSTIFY)]:
+                styles.add(ParagraphStyle(
+                    name=f'Normal{align_name}',
+                    parent=styles['Normal'],
+                    alignment=align_val
+                ))
+            
+            # excel_to_pdf sheet titles
+            styles.add(ParagraphStyle('SheetTitle', parent=styles['Heading1'],
+                                      fontSize=14, textColor=colors.HexColor('#2C3E50'),
+                                      spaceAfter=12, fontName='Helvetica-Bold'))
+            
+            # ppt_to_pdf slide text
+            styles.add(ParagraphStyle('CustomTitle', parent=styles['Heading1'],
+                                      fontSize=24, textColor=colors.HexColor('#2C3E50'),
+                                      alignment=TA_CENTER, spaceAfter=20,
+                                      fontName='Helvetica-Bold', spaceBefore=10))
+            styles.add(ParagraphStyle('CustomSubtitle', parent=styles['Heading2'],
+                                      fontSize=16, textColor=colors.HexColor('#34495E'),
+                                      alignment=TA_CENTER, spaceAfter=15,
+                                      fontName='Helvetica'))
+            styles.add(ParagraphStyle('CustomHeading', parent=styles['Heading2'],
+                                      fontSize=18, textColor=colors.HexColor('#2C3E50'),
+                                      spaceAfter=12, fontName='Helvetica-Bold'))
+            
+            # html_to_pdf table header cells that need a Paragraph; matches the header row's table style
+            styles.add(ParagraphStyle('TableHeader', parent=styles['Normal'],
+                                      fontName='Helvetica-Bold', textColor=colors.whitesmoke,
+                                      alignment=TA_CENTER))
+            
+            STYLES = styles
+    return STYLES
+
+def find_soffice():
+    """LibreOffice's command-line binary, or None when it isn't installed"""
+    import shutil
+    
+    for name in ('soffice', 'libreoffice'):
+        path = shutil.which(name)
+        if path:
+            return path
+    
+    # Default Windows install locations
+    for base in (os.environ.get('ProgramFiles'), os.environ.get('ProgramFiles(x86)')):
+        if base:
+            path = os.path.join(base, 'LibreOffice', 'program', 'soffice.exe')
+            if os.path.exists(path):
+                return path
+    return None
+
+def soffice_pdf_to_docx(soffice, input_path, output_path):
+    """Convert with headless LibreOffice; returns False if it could not produce the file"""
+    import shutil
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as out_dir:
+        # A private profile keeps an already running LibreOffice from taking over the job
+        profile_url = Path(out_dir, 'profile').as_uri()
+        try:
+            subprocess.run([soffice, f'-env:UserInstallation={profile_url}', '--headless',
+                            '--infilter=writer_pdf_import', '--convert-to', 'docx:MS Word 2007 XML',
+                            '--outdir', out_dir, os.path.abspath(input_path)],
+                           capture_output=True, timeout=300, check=True)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return False
+        
+        produced = os.path.join(out_dir, os.path.splitext(os.path.basename(input_path))[0] + '.docx')
+        if not os.path.exists(produced):
+            return False
+        shutil.move(produced, output_path)
+    return True
+
 def pdf_to_word(input_path, output_path):
     """Convert PDF to Word DOCX with enhanced formatting preservation"""
+    # LibreOffice's native PDF import is much faster than pdf2docx's Python layout analysis,
+    # but builds positioned frames instead of flowing text, so UBPDF_PDF_TO_WORD=soffice
+    # opts in to it; pdf2docx stays the default so output doesn't depend on the host
+    if os.environ.get('UBPDF_PDF_TO_WORD', 'pdf2docx').strip().lower() == 'soffice':
+        soffice = find_soffice()
+        if soffice and soffice_pdf_to_docx(soffice, input_path, output_path):
+            print(f"SUCCESS: Converted PDF to Word: {output_path}")
+            return
+    
     from pdf2docx import Converter
     
     cv = Converter(input_path)
@@ -81,7 +353,7 @@ def word_to_pdf(input_path, output_path):
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage, PageBreak, ListFlowable, ListItem
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.styles import ParagraphStyle
     from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
     from reportlab.lib.units import inch
     from reportlab.lib import colors
@@ -90,7 +362,6 @@ def word_to_pdf(input_path, output_path):
     import re
     import io
     import os
-    import tempfile
     
     def rgb_to_hex(rgb_str):
         """Convert Word RGB color to hex color"""
@@ -117,32 +388,9 @@ def word_to_pdf(input_path, output_path):
     pdf = SimpleDocTemplate(output_path, pagesize=letter,
                            topMargin=0.75*inch, bottomMargin=0.75*inch,
                            leftMargin=0.75*inch, rightMargin=0.75*inch)
-    styles = getSampleStyleSheet()
+    styles = get_styles()
     story = []
     
-    # Add comprehensive custom styles
-    for i in range(1, 7):
-        font_sizes = {1: 18, 2: 16, 3: 14, 4: 12, 5: 11, 6: 10}
-        styles.add(ParagraphStyle(
-            name=f'CustomHeading{i}',
-            parent=styles['Heading1'],
-            fontSize=font_sizes.get(i, 12),
-            fontName='Helvetica-Bold',
-            spaceAfter=12,
-            spaceBefore=6,
-            textColor=colors.HexColor('#2E4053')
-        ))
-    
-    # Add alignment variants
-    for align_name, align_val in [('Left', TA_LEFT), ('Center', TA_CENTER), ('Right', TA_RIGHT), ('Justify', TA_JUSTIFY)]:
-        styles.add(ParagraphStyle(
-            name=f'Normal{align_name}',
-            parent=styles['Normal'],
-            alignment=align_val
-        ))
-    
-    # Create temp directory for image extraction
-    temp_dir = tempfile.mkdtemp()
     image_counter = 0
     
     # Helper function to extract and format run text
@@ -241,12 +489,9 @@ def word_to_pdf(input_path, output_path):
                                     image_data = rel.target_part.blob
                                     image_counter += 1
                                     
-                                    img_path = os.path.join(temp_dir, f"img_{image_counter}.png")
-                                    with open(img_path, 'wb') as img_file:
-                                        img_file.write(image_data)
-                                    
                                     try:
-                                        img = RLImage(img_path)
+                                        # Sized and drawn from one in-memory reader
+                                        img = RLImage(io.BytesIO(image_data))
                                         max_width = 6.5 * inch
                                         max_height = 8 * inch
                                         
@@ -407,6 +652,8 @@ def word_to_pdf(input_path, output_path):
                             if cell_color:
                                 table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), cell_color))
                     
+                    row_has_color = [any(row_styles) for row_styles in cell_styles]
+                    
                     # Default header styling if no custom colors
                     if not cell_styles[0][0]:
                         table_style.append(('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#366092')))
@@ -414,7 +661,7 @@ def word_to_pdf(input_path, output_path):
                     
                     # Alternating row colors for non-header rows
                     for row_idx in range(1, len(table_data)):
-                        if not any(cell_styles[row_idx]):
+                        if not row_has_color[row_idx]:
                             bg_color = colors.white if row_idx % 2 == 1 else colors.HexColor('#f9f9f9')
                             table_style.append(('BACKGROUND', (0, row_idx), (-1, row_idx), bg_color))
                     
@@ -429,20 +676,6 @@ def word_to_pdf(input_path, output_path):
     except Exception as e:
         print(f"ERROR: Failed to build PDF: {str(e)}")
         raise
-    finally:
-        # Clean up temp directory
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
-    
-    # Cleanup temp directory
-    try:
-        import shutil
-        shutil.rmtree(temp_dir)
-    except:
-        pass
     
     print(f"SUCCESS: Converted Word to PDF: {output_path}")
     if image_counter > 0:
@@ -450,12 +683,13 @@ def word_to_pdf(input_path, output_path):
 
 def pdf_to_excel(input_path, output_path):
     """Extract tables from PDF to Excel - one table per worksheet"""
-    import pdfplumber
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    from openpyxl.utils import get_column_letter
     
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows to disk instead of holding every cell
+    wb = openpyxl.Workbook(write_only=True)
     
     border = Border(
         left=Side(style='thin'),
@@ -463,68 +697,75 @@ def pdf_to_excel(input_path, output_path):
         top=Side(style='thin'),
         bottom=Side(style='thin')
     )
+    info_font = Font(italic=True, size=10, color='666666')
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_font = Font(bold=True, color='FFFFFF', size=11)
+    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    body_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
     
     table_count = 0
     
-    with pdfplumber.open(input_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
-            tables = page.extract_tables()
-            
-            if tables:
-                for table_idx, table in enumerate(tables, 1):
-                    table_count += 1
-                    
-                    # Create new worksheet for each table
-                    # Sheet names: "Table_1", "Table_2", etc. or "Page1_Table1" format
-                    sheet_name = f"Page{page_num}_T{table_idx}" if len(tables) > 1 else f"Page{page_num}"
-                    # Excel sheet names limited to 31 chars
-                    sheet_name = sheet_name[:31]
-                    
-                    ws = wb.create_sheet(title=sheet_name)
-                    current_row = 1
-                    
-                    # Add page info at top
-                    info_cell = ws.cell(row=current_row, column=1, value=f"Source: Page {page_num}, Table {table_idx}")
-                    info_cell.font = Font(italic=True, size=10, color='666666')
-                    current_row += 1
-                    current_row += 1  # Add spacing
+    # Tables are extracted in parallel; the workbook is written here in page order
+    for page_num, tables in enumerate(map_pdf_pages(input_path, page_tables), 1):
+        if tables:
+            for table_idx, table in enumerate(tables, 1):
+                table_count += 1
+                
+                # Create new worksheet for each table
+                # Sheet names: "Table_1", "Table_2", etc. or "Page1_Table1" format
+                sheet_name = f"Page{page_num}_T{table_idx}" if len(tables) > 1 else f"Page{page_num}"
+                # Excel sheet names limited to 31 chars
+                sheet_name = sheet_name[:31]
+                
+                ws = wb.create_sheet(title=sheet_name)
+                info_text = f"Source: Page {page_num}, Table {table_idx}"
+                
+                # Auto-adjust column widths; they must be set before the first row is streamed
+                max_lengths = [len(info_text)]
+                for row_data in table:
+                    for col_num, cell_value in enumerate(row_data):
+                        length = len(str(cell_value)) if cell_value else 0
+                        if col_num < len(max_lengths):
+                            max_lengths[col_num] = max(max_lengths[col_num], length)
+                        else:
+                            max_lengths.append(length)
+                for col_num, max_length in enumerate(max_lengths, 1):
+                    ws.column_dimensions[get_column_letter(col_num)].width = min(max_length + 2, 60)
+                
+                # Add page info at top
+                info_cell = WriteOnlyCell(ws, value=info_text)
+                info_cell.font = info_font
+                ws.append([info_cell])
+                ws.append([])  # Add spacing
+                
+                # Table header
+                if table:
+                    header_cells = []
+                    for cell_value in table[0]:
+                        cell = WriteOnlyCell(ws, value=cell_value)
+                        cell.fill = header_fill
+                        cell.font = header_font
+                        cell.alignment = header_alignment
+                        cell.border = border
+                        header_cells.append(cell)
+                    ws.append(header_cells)
                     
-                    # Table header
-                    if table:
-                        for col_num, cell_value in enumerate(table[0], 1):
-                            cell = ws.cell(row=current_row, column=col_num, value=cell_value)
-                            cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                            cell.font = Font(bold=True, color='FFFFFF', size=11)
-                            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+                    # Table data
+                    for row_data in table[1:]:
+                        row_cells = []
+                        for cell_value in row_data:
+                            cell = WriteOnlyCell(ws, value=cell_value)
                             cell.border = border
-                        current_row += 1
-                        
-                        # Table data
-                        for row_data in table[1:]:
-                            for col_num, cell_value in enumerate(row_data, 1):
-                                cell = ws.cell(row=current_row, column=col_num, value=cell_value)
-                                cell.border = border
-                                cell.alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
-                            current_row += 1
-                    
-                    # Auto-adjust column widths
-                    for column in ws.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        for cell in column:
-                            try:
-                                if cell.value and len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = min(max_length + 2, 60)
-                        ws.column_dimensions[column_letter].width = adjusted_width
+                            cell.alignment = body_alignment
+                            row_cells.append(cell)
+                        ws.append(row_cells)
     
     # If no tables found, create a default sheet with message
     if table_count == 0:
         ws = wb.create_sheet(title="No Tables Found")
-        ws.cell(row=1, column=1, value="No tables were detected in the PDF file.")
-        ws.cell(row=1, column=1).font = Font(italic=True, color='FF0000')
+        cell = WriteOnlyCell(ws, value="No tables were detected in the PDF file.")
+        cell.font = Font(italic=True, color='FF0000')
+        ws.append([cell])
     
     wb.save(output_path)
     print(f"SUCCESS: Extracted {table_count} table(s) to Excel: {output_path}")
@@ -536,7 +777,7 @@ def excel_to_pdf(input_path, output_path):
     from openpyxl.utils import get_column_letter
     from reportlab.lib.pagesizes import letter, landscape, A4, A3
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.styles import ParagraphStyle
     from reportlab.lib import colors
     from reportlab.lib.units import inch
     
@@ -596,7 +837,7 @@ def excel_to_pdf(input_path, output_path):
                            topMargin=0.4*inch, bottomMargin=0.4*inch,
                            leftMargin=0.4*inch, rightMargin=0.4*inch)
     
-    styles = getSampleStyleSheet()
+    styles = get_styles()
     story = []
     
     # Process each worksheet
@@ -606,26 +847,24 @@ def excel_to_pdf(input_path, output_path):
         
         # Add sheet title
         if len(wb.worksheets) > 1:
-            title_style = ParagraphStyle('SheetTitle', parent=styles['Heading1'],
-                                        fontSize=14, textColor=colors.HexColor('#2C3E50'),
-                                        spaceAfter=12, fontName='Helvetica-Bold')
-            story.append(Paragraph(f"<b>{ws.title}</b>", title_style))
+            story.append(Paragraph(f"<b>{ws.title}</b>", styles['SheetTitle']))
             story.append(Spacer(1, 0.15*inch))
         
         # Find actual data range (skip empty rows/columns)
         min_row, max_row, min_col, max_col = None, None, None, None
         
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.value is not None and str(cell.value).strip():
-                    if min_row is None or cell.row < min_row:
-                        min_row = cell.row
-                    if max_row is None or cell.row > max_row:
-                        max_row = cell.row
-                    if min_col is None or cell.column < min_col:
-                        min_col = cell.column
-                    if max_col is None or cell.column > max_col:
-                        max_col = cell.column
+        # Plain values from row 1 / column 1 on; no Cell objects are needed to find the range
+        for row_num, row_values in enumerate(ws.values, 1):
+            filled_cols = [col_num for col_num, value in enumerate(row_values, 1)
+                           if value is not None and str(value).strip()]
+            if filled_cols:
+                if min_row is None:
+                    min_row = row_num
+                max_row = row_num
+                if min_col is None or filled_cols[0] < min_col:
+                    min_col = filled_cols[0]
+                if max_col is None or filled_cols[-1] > max_col:
+                    max_col = filled_cols[-1]
         
         # Skip empty sheets
         if min_row is None or max_row is None:
@@ -810,10 +1049,9 @@ def html_to_pdf(input_path, output_path):
     """Comprehensive HTML to PDF conversion with images, tables, lists, and formatting"""
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage, ListFlowable, ListItem, PageBreak
     from reportlab.lib.pagesizes import letter, landscape
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.lib import colors
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     from html.parser import HTMLParser
     from html import unescape
     from urllib.parse import urljoin, urlparse
@@ -822,7 +1060,6 @@ def html_to_pdf(input_path, output_path):
     import os
     import base64
     import io
-    import tempfile
     import requests
     
     class ComprehensiveHTMLParser(HTMLParser):
@@ -1094,6 +1331,32 @@ def html_to_pdf(input_path, output_path):
                 print(f"  Warning: Could not load image: {src} ({e})")
             
             return None
+        
+        def feed_tree(self, html_content):
+            """Drive the same handlers from lxml's C parser instead of HTMLParser's tokenizer"""
+            from lxml import etree, html as lxml_html
+            
+            try:
+                root = lxml_html.document_fromstring(html_content.encode('utf-8'),
+                                                     parser=lxml_html.HTMLParser(encoding='utf-8'))
+            except etree.ParserError:
+                # Empty, whitespace-only or comment-only documents have no root element
+                self.feed(html_content)
+                return
+            
+            def walk(element):
+                # Comments and processing instructions only contribute their tail
+                if isinstance(element.tag, str):
+                    self.handle_starttag(element.tag, element.items())
+                    if element.text:
+                        self.handle_data(element.text)
+                    for child in element:
+                        walk(child)
+                    self.handle_endtag(element.tag)
+                if element.tail:
+                    self.handle_data(element.tail)
+            
+            walk(root)
     
     # Read HTML file
     with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -1101,7 +1364,10 @@ def html_to_pdf(input_path, output_path):
     
     # Parse HTML
     parser = ComprehensiveHTMLParser(input_path)
-    parser.feed(html_content)
+    try:
+        parser.feed_tree(html_content)
+    except ImportError:
+        parser.feed(html_content)  # lxml not installed
     parser.flush_text()
     
     # Determine page size based on content
@@ -1117,31 +1383,9 @@ def html_to_pdf(input_path, output_path):
                            topMargin=0.75*inch, bottomMargin=0.75*inch,
                            leftMargin=0.75*inch, rightMargin=0.75*inch)
     
-    styles = getSampleStyleSheet()
-    
-    # Add custom styles
-    for i in range(1, 7):
-        font_sizes = {1: 20, 2: 16, 3: 14, 4: 12, 5: 11, 6: 10}
-        styles.add(ParagraphStyle(
-            name=f'CustomH{i}',
-            parent=styles['Heading1'],
-            fontSize=font_sizes.get(i, 12),
-            fontName='Helvetica-Bold',
-            spaceAfter=12,
-            spaceBefore=6,
-            textColor=colors.HexColor('#2C3E50')
-        ))
-    
-    # Alignment styles
-    for align_name, align_val in [('Center', TA_CENTER), ('Right', TA_RIGHT), ('Justify', TA_JUSTIFY)]:
-        styles.add(ParagraphStyle(
-            name=f'Normal{align_name}',
-            parent=styles['Normal'],
-            alignment=align_val
-        ))
+    styles = get_styles()
     
     story = []
-    temp_dir = tempfile.mkdtemp()
     image_counter = 0
     
     # Build PDF content
@@ -1150,12 +1394,9 @@ def html_to_pdf(input_path, output_path):
             # Handle images
             try:
                 image_counter += 1
-                img_path = os.path.join(temp_dir, f"img_{image_counter}.png")
                 
-                with open(img_path, 'wb') as f:
-                    f.write(content['data'])
-                
-                img = RLImage(img_path)
+                # Sized and drawn from one in-memory reader
+                img = RLImage(io.BytesIO(content['data']))
                 max_width = pagesize[0] - 1.5*inch
                 max_height = 6*inch
                 
@@ -1188,30 +1429,41 @@ def html_to_pdf(input_path, output_path):
             if not table_rows:
                 continue
             
+            # Calculate column widths
+            num_cols = len(table_rows[0])
+            available_width = pagesize[0] - 1.5*inch
+            col_widths = [available_width / num_cols] * num_cols
+            
+            # Plain text that fits on one line is drawn by the Table itself; only
+            # markup, entities or wrapping text need a Paragraph
+            max_text_width = col_widths[0] - 10  # Less left/right padding
+            has_header = bool(table_rows[0]) and table_rows[0][0].get('is_header')
             table_data = []
-            for row in table_rows:
+            for row_idx, row in enumerate(table_rows):
+                # Paragraph cells in the header row get the same white bold text as plain ones
+                cell_style = styles['TableHeader'] if has_header and row_idx == 0 else styles['Normal']
                 row_data = []
                 for cell in row:
                     cell_text = cell['text']
-                    if cell_text:
-                        para = Paragraph(cell_text, styles['Normal'])
-                        row_data.append(para)
-                    else:
+                    if not cell_text:
                         row_data.append('')
+                    elif ('<' in cell_text or '&' in cell_text
+                          or stringWidth(cell_text, 'Helvetica-Bold', 10) > max_text_width):
+                        row_data.append(Paragraph(cell_text, cell_style))
+                    else:
+                        # Paragraph would collapse runs of whitespace the same way
+                        row_data.append(' '.join(cell_text.split()))
                 table_data.append(row_data)
             
             if table_data:
-                # Calculate column widths
-                num_cols = len(table_data[0])
-                available_width = pagesize[0] - 1.5*inch
-                col_widths = [available_width / num_cols] * num_cols
-                
                 t = Table(table_data, colWidths=col_widths, repeatRows=1)
                 
+                # Font and leading match the Normal style used for Paragraph cells
                 table_style = [
                     ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                     ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('LEADING', (0, 0), (-1, -1), 12),
                     ('TOPPADDING', (0, 0), (-1, -1), 6),
                     ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
                     ('LEFTPADDING', (0, 0), (-1, -1), 5),
@@ -1220,7 +1472,7 @@ def html_to_pdf(input_path, output_path):
                 ]
                 
                 # Header styling
-                if table_rows and table_rows[0] and table_rows[0][0].get('is_header'):
+                if has_header:
                     table_style.extend([
                         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')),
                         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -1292,13 +1544,6 @@ def html_to_pdf(input_path, output_path):
     except Exception as e:
         print(f"ERROR: Failed to build PDF: {str(e)}")
         raise
-    finally:
-        # Clean up temp directory
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
 
 def ppt_to_pdf(input_path, output_path):
     """Comprehensive PowerPoint to PDF conversion with full formatting preservation"""
@@ -1306,30 +1551,73 @@ def ppt_to_pdf(input_path, output_path):
     from pptx.enum.shapes import MSO_SHAPE_TYPE
     from pptx.util import Pt
     from reportlab.lib.pagesizes import letter, landscape
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image as RLImage
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Flowable
+    from reportlab.lib.styles import ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.lib import colors
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
+    from reportlab.lib.utils import ImageReader
+    from collections import OrderedDict
     from PIL import Image
+    import numpy as np
+    import hashlib
     import io
     import os
     import tempfile
     
-    def rgb_to_color(rgb):
-        """Convert RGB tuple to ReportLab color"""
-        if rgb is None:
-            return None
-        try:
-            if hasattr(rgb, 'rgb'):
-                # Convert from RGBColor object
-                r = (rgb.rgb >> 16) & 0xFF
-                g = (rgb.rgb >> 8) & 0xFF
-                b = rgb.rgb & 0xFF
-                return colors.Color(r/255.0, g/255.0, b/255.0)
-            return None
-        except:
-            return None
+    # Images larger than this are spilled to disk until drawn, each distinct image once,
+    # into a single temp file: (offset, length) by image key
+    spill_threshold = 1024 * 1024
+    spill_file = None
+    spilled = {}
+    # Decoded images kept alive at once (repeated logos reuse the same entry)
+    decoded_cache = OrderedDict()
+    decoded_cache_size = 8
+    
+    class LazyImage(Flowable):
+        """Image flowable that keeps only the encoded bytes until it is drawn"""
+        
+        def __init__(self, image_bytes, width, height):
+            nonlocal spill_file
+            Flowable.__init__(self)
+            self.key = hashlib.sha1(image_bytes).hexdigest()
+            if len(image_bytes) > spill_threshold:
+                # Keep big images out of memory while the story is built
+                if self.key not in spilled:
+                    if spill_file is None:
+                        spill_file = tempfile.TemporaryFile()
+                    spill_file.seek(0, os.SEEK_END)
+                    spilled[self.key] = (spill_file.tell(), len(image_bytes))
+                    spill_file.write(image_bytes)
+                self.source = None
+            else:
+                self.source = image_bytes
+            self.drawWidth = width
+            self.drawHeight = height
+        
+        def read_bytes(self):
+            if self.source is not None:
+                return self.source
+            offset, length = spilled[self.key]
+            spill_file.seek(offset)
+            return spill_file.read(length)
+        
+        def get_reader(self):
+            reader = decoded_cache.get(self.key)
+            if reader is not None:
+                decoded_cache.move_to_end(self.key)
+                return reader
+            reader = ImageReader(io.BytesIO(self.read_bytes()))
+            decoded_cache[self.key] = reader
+            if len(decoded_cache) > decoded_cache_size:
+                decoded_cache.popitem(last=False)
+            return reader
+        
+        def wrap(self, availWidth, availHeight):
+            return self.drawWidth, self.drawHeight
+        
+        def draw(self):
+            self.canv.drawImage(self.get_reader(), 0, 0, self.drawWidth, self.drawHeight, mask='auto')
     
     def get_text_alignment(alignment):
         """Convert PowerPoint alignment to ReportLab alignment"""
@@ -1345,6 +1633,37 @@ def ppt_to_pdf(input_path, output_path):
         except:
             return TA_LEFT
     
+    def body_style(name, para, font_size):
+        """Build the ParagraphStyle for a body paragraph of a text frame"""
+        # Create custom style with alignment
+        para_style = ParagraphStyle(
+            name,
+            parent=styles['Normal'],
+            alignment=get_text_alignment(para.alignment),
+            fontSize=12,
+            leading=14.4
+        )
+        
+        # Check bullet level
+        if para.level is not None and para.level >= 0:
+            indent = para.level * 25
+            para_style.leftIndent = indent + 15
+            para_style.bulletIndent = indent
+            para_style.spaceAfter = 6
+        
+        if font_size:
+            para_style.fontSize = font_size
+            para_style.leading = font_size * 1.2
+        
+        return para_style
+    
+    def add_spacer(height):
+        """Add vertical space, growing a directly preceding Spacer instead of stacking another"""
+        if story and isinstance(story[-1], Spacer):
+            story[-1].height += height
+        else:
+            story.append(Spacer(1, height))
+    
     def format_run_text(run):
         """Format a single text run with comprehensive styling"""
         text = run.text
@@ -1400,27 +1719,15 @@ def ppt_to_pdf(input_path, output_path):
     pdf = SimpleDocTemplate(output_path, pagesize=pagesize,
                            topMargin=0.5*inch, bottomMargin=0.5*inch,
                            leftMargin=0.75*inch, rightMargin=0.75*inch)
-    styles = getSampleStyleSheet()
+    styles = get_styles()
     story = []
     
-    # Create temp directory for image extraction
-    temp_dir = tempfile.mkdtemp()
     image_counter = 0
     
     # Custom styles
-    title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'],
-                                 fontSize=24, textColor=colors.HexColor('#2C3E50'),
-                                 alignment=TA_CENTER, spaceAfter=20,
-                                 fontName='Helvetica-Bold', spaceBefore=10)
-    
-    subtitle_style = ParagraphStyle('CustomSubtitle', parent=styles['Heading2'],
-                                    fontSize=16, textColor=colors.HexColor('#34495E'),
-                                    alignment=TA_CENTER, spaceAfter=15,
-                                    fontName='Helvetica')
-    
-    heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'],
-                                   fontSize=18, textColor=colors.HexColor('#2C3E50'),
-                                   spaceAfter=12, fontName='Helvetica-Bold')
+    title_style = styles['CustomTitle']
+    subtitle_style = styles['CustomSubtitle']
+    heading_style = styles['CustomHeading']
     
     for slide_num, slide in enumerate(prs.slides, 1):
         if slide_num > 1:
@@ -1430,7 +1737,7 @@ def ppt_to_pdf(input_path, output_path):
         slide_header = f'<font size=10 color="#7F8C8D"><b>Slide {slide_num}</b></font>'
         slide_label = Paragraph(slide_header, styles['Normal'])
         story.append(slide_label)
-        story.append(Spacer(1, 0.15*inch))
+        add_spacer(0.15*inch)
         
         # Track if we've found the title
         title_found = False
@@ -1444,29 +1751,29 @@ def ppt_to_pdf(input_path, output_path):
                 try:
                     image_stream = shape.image.blob
                     image_counter += 1
-                    img_path = os.path.join(temp_dir, f"slide_{slide_num}_img_{image_counter}.png")
                     
-                    with open(img_path, 'wb') as img_file:
-                        img_file.write(image_stream)
+                    # Only the header is parsed here; pixels are decoded at draw time
+                    with Image.open(io.BytesIO(image_stream)) as pil_img:
+                        img_width, img_height = pil_img.size
                     
                     # Add image to PDF with proper sizing
-                    img = RLImage(img_path)
                     max_width = pagesize[0] - 1.5*inch
                     max_height = 6*inch
                     
-                    if img.drawWidth > max_width:
-                        ratio = max_width / img.drawWidth
-                        img.drawWidth = max_width
-                        img.drawHeight = img.drawHeight * ratio
+                    if img_width > max_width:
+                        ratio = max_width / img_width
+                        img_width = max_width
+                        img_height = img_height * ratio
                     
-                    if img.drawHeight > max_height:
-                        ratio = max_height / img.drawHeight
-                        img.drawHeight = max_height
-                        img.drawWidth = img.drawWidth * ratio
+                    if img_height > max_height:
+                        ratio = max_height / img_height
+                        img_height = max_height
+                        img_width = img_width * ratio
                     
+                    img = LazyImage(image_stream, img_width, img_height)
                     img.hAlign = 'CENTER'
                     story.append(img)
-                    story.append(Spacer(1, 0.15*inch))
+                    add_spacer(0.15*inch)
                 except Exception as e:
                     pass
             
@@ -1495,6 +1802,11 @@ def ppt_to_pdf(input_path, output_path):
                     is_title = True
                     title_found = True
                 
+                # Consecutive paragraphs with the same style become one Paragraph
+                pending_texts = []
+                pending_key = None
+                pending_style = None
+                
                 # Process paragraphs
                 for para in text_frame.paragraphs:
                     if not para.text.strip():
@@ -1510,55 +1822,54 @@ def ppt_to_pdf(input_path, output_path):
                     
                     # Determine style
                     if is_title:
-                        p = Paragraph(formatted_text, title_style)
+                        style_key = 'title'
                     elif is_subtitle:
-                        p = Paragraph(formatted_text, subtitle_style)
+                        style_key = 'subtitle'
                     else:
-                        # Get alignment
-                        alignment = get_text_alignment(para.alignment)
-                        
-                        # Create custom style with alignment
-                        para_style = ParagraphStyle(
-                            f'TempPara_{slide_num}_{shape_idx}',
-                            parent=styles['Normal'],
-                            alignment=alignment,
-                            fontSize=12,
-                            leading=14.4
-                        )
+                        # Get font size from first run
+                        font_size = para.runs[0].font.size.pt if para.runs and para.runs[0].font.size else None
+                        style_key = (para.alignment, para.level, font_size)
                         
-                        # Check bullet level
+                        # Add bullet based on level
                         if para.level is not None and para.level >= 0:
-                            indent = para.level * 25
-                            para_style.leftIndent = indent + 15
-                            para_style.bulletIndent = indent
-                            para_style.spaceAfter = 6
-                            
-                            # Add bullet based on level
                             bullet_chars = ['•', '◦', '▪', '▫', '–', '·']
                             bullet = bullet_chars[min(para.level, len(bullet_chars)-1)]
                             formatted_text = f'{bullet} {formatted_text}'
+                    
+                    if style_key != pending_key:
+                        if pending_texts:
+                            story.append(Paragraph('<br/>'.join(pending_texts), pending_style))
+                            add_spacer(0.08*inch)
+                            pending_texts = []
                         
-                        # Get font size from first run
-                        if para.runs and para.runs[0].font.size:
-                            para_style.fontSize = para.runs[0].font.size.pt
-                            para_style.leading = para_style.fontSize * 1.2
-                        
-                        p = Paragraph(formatted_text, para_style)
+                        if is_title:
+                            pending_style = title_style
+                        elif is_subtitle:
+                            pending_style = subtitle_style
+                        else:
+                            pending_style = body_style(f'TempPara_{slide_num}_{shape_idx}', para, font_size)
+                        pending_key = style_key
                     
-                    story.append(p)
-                    story.append(Spacer(1, 0.08*inch))
+                    pending_texts.append(formatted_text)
+                
+                if pending_texts:
+                    story.append(Paragraph('<br/>'.join(pending_texts), pending_style))
+                    add_spacer(0.08*inch)
             
             # Handle tables
             elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
                 table = shape.table
                 table_data = []
-                cell_colors = []
                 
-                for row in table.rows:
+                # Solid cell fills as flat arrays instead of per-cell color objects
+                num_rows, num_cols = len(table.rows), len(table.columns)
+                has_color = np.zeros((num_rows, num_cols), dtype=bool)
+                fill_rgb = np.zeros((num_rows, num_cols, 3), dtype=np.uint8)
+                
+                for row_idx, row in enumerate(table.rows):
                     row_data = []
-                    row_colors = []
                     
-                    for cell in row.cells:
+                    for col_idx, cell in enumerate(row.cells):
                         # Get cell text with formatting
                         cell_paragraphs = []
                         for para in cell.text_frame.paragraphs:
@@ -1580,15 +1891,12 @@ def ppt_to_pdf(input_path, output_path):
                         try:
                             fill = cell.fill
                             if fill.type == 1:  # SOLID
-                                cell_color = rgb_to_color(fill.fore_color)
-                                row_colors.append(cell_color)
-                            else:
-                                row_colors.append(None)
+                                fill_rgb[row_idx, col_idx] = tuple(fill.fore_color.rgb)
+                                has_color[row_idx, col_idx] = True
                         except:
-                            row_colors.append(None)
+                            pass
                     
                     table_data.append(row_data)
-                    cell_colors.append(row_colors)
                 
                 if table_data:
                     # Calculate column widths
@@ -1611,28 +1919,29 @@ def ppt_to_pdf(input_path, output_path):
                     ]
                     
                     # Apply cell background colors
-                    for row_idx, row_colors in enumerate(cell_colors):
-                        for col_idx, cell_color in enumerate(row_colors):
-                            if cell_color:
-                                table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), cell_color))
+                    for row_idx, col_idx in np.argwhere(has_color).tolist():
+                        r, g, b = fill_rgb[row_idx, col_idx].tolist()
+                        cell_color = colors.Color(r/255.0, g/255.0, b/255.0)
+                        table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), cell_color))
                     
                     # Default styling if no custom colors
-                    if not any(cell_colors[0]):
+                    row_has_color = has_color.any(axis=1).tolist()
+                    if not row_has_color[0]:
                         table_style.append(('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2C3E50')))
                         table_style.append(('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke))
                         table_style.append(('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'))
                     
                     # Alternating row colors
                     for row_idx in range(1, len(table_data)):
-                        if not any(cell_colors[row_idx]):
+                        if not row_has_color[row_idx]:
                             bg_color = colors.white if row_idx % 2 == 1 else colors.HexColor('#ECF0F1')
                             table_style.append(('BACKGROUND', (0, row_idx), (-1, row_idx), bg_color))
                     
                     t.setStyle(TableStyle(table_style))
                     story.append(t)
-                    story.append(Spacer(1, 0.2*inch))
+                    add_spacer(0.2*inch)
         
-        story.append(Spacer(1, 0.2*inch))
+        add_spacer(0.2*inch)
     
     # Build PDF
     try:
@@ -1642,19 +1951,254 @@ def ppt_to_pdf(input_path, output_path):
         print(f"ERROR: Failed to build PDF: {str(e)}")
         raise
     finally:
-        # Clean up temp directory
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
+        decoded_cache.clear()
+        if spill_file is not None:
+            spill_file.close()
+
+@lru_cache(maxsize=None)
+def font_style_flags(fontname):
+    """(bold, italic) as told by a font's name"""
+    name = fontname.lower()
+    return 'bold' in name, 'italic' in name or 'oblique' in name
+
+@lru_cache(maxsize=256)
+def resolve_span_format(size, color):
+    """Return (tag, style attribute) for a text span of the given size and color"""
+    # Detect heading based on size
+    if size > 20:
+        tag = "h1"
+    elif size > 16:
+        tag = "h2"
+    elif size > 14:
+        tag = "h3"
+    else:
+        tag = "span"
+    
+    # Build style
+    style_parts = []
+    if size != 12:
+        style_parts.append(f"font-size: {size}pt")
+    
+    if color != 0:
+        r = (color >> 16) & 255
+        g = (color >> 8) & 255
+        b = color & 255
+        style_parts.append(f"color: rgb({r}, {g}, {b})")
+    
+    style_str = "; ".join(style_parts)
+    style_attr = f' style="{style_str}"' if style_str else ""
+    return tag, style_attr
+
+def extract_html_page(pdf_fitz, page_num):
+    """
+    HTML for one page of pdf_to_html, as plain data that can cross process boundaries
+    
+    Returns (content, images): content is a list of (y_position, html) for text
+    blocks and tables; images is a list of (y_position, bytes, ext) in page order,
+    with y_position None for images that have no placement on the page.
+    """
+    from html import escape
+    
+    page_fitz = pdf_fitz[page_num]
+    
+    # Text blocks are needed below anyway; a page without any text (blank or
+    # scanned) cannot hold a table that passes the fill check, so its table
+    # search is skipped
+    text_blocks = page_fitz.get_text("dict")
+    has_text = any(block.get("type") == 0 for block in text_blocks.get("blocks", []))
+    
+    # Step 1: Extract tables with their bounding boxes using PyMuPDF
+    tables_data = []
+    try:
+        tables = page_fitz.find_tables(**TABLE_SETTINGS).tables if has_text else []
+        for table_obj in tables:
+            table_bbox = table_obj.bbox  # (x0, top, x1, bottom)
+            extracted_table = table_obj.extract()
+            
+            # Validate table
+            if not extracted_table or len(extracted_table) < 2:
+                continue
+            
+            # Count filled cells
+            filled_count = 0
+            total_count = 0
+            for row in extracted_table:
+                for cell in row:
+                    total_count += 1
+                    if cell and str(cell).strip():
+                        filled_count += 1
+            
+            # Skip if less than 30% filled or too few cells
+            if total_count < 4 or (filled_count / total_count) < 0.3:
+                continue
+            
+            tables_data.append({
+                'bbox': table_bbox,
+                'data': extracted_table,
+                'y_position': table_bbox[1]  # top coordinate
+            })
+    except:
+        pass
+    
+    # Step 2: Extract images with positions
+    images_data = []
+    try:
+        image_list = page_fitz.get_images()
+        for img_index, img_info in enumerate(image_list):
+            try:
+                xref = img_info[0]
+                base_image = pdf_fitz.extract_image(xref)
+                image_bytes = base_image["image"]
+                image_ext = base_image["ext"]
+            except:
+                continue
+            
+            # Get image position; the image is still saved when it has none
+            try:
+                img_rects = page_fitz.get_image_rects(xref)
+            except:
+                img_rects = None
+            images_data.append((img_rects[0].y0 if img_rects else None, image_bytes, image_ext))
+    except:
+        pass
+    
+    # Local aliases for the per-cell table serialization
+    _esc = escape
+    _str = str
+    
+    # Step 3: Extract text blocks, excluding table areas
+    text_blocks_data = []
+    
+    for block in text_blocks.get("blocks", []):
+        if block.get("type") != 0:  # Skip non-text blocks
+            continue
+        
+        block_bbox = block.get("bbox")  # (x0, y0, x1, y1)
+        if not block_bbox:
+            continue
+        
+        # Check if this block overlaps with any table
+        is_in_table = False
+        for table_info in tables_data:
+            table_bbox = table_info['bbox']  # (x0, top, x1, bottom)
+            # Check overlap
+            if (block_bbox[0] < table_bbox[2] and block_bbox[2] > table_bbox[0] and
+                block_bbox[1] < table_bbox[3] and block_bbox[3] > table_bbox[1]):
+                is_in_table = True
+                break
+        
+        if is_in_table:
+            continue  # Skip text that's part of a table
+        
+        # Process text block
+        block_html = ""
+        for line in block.get("lines", []):
+            line_html = ""
+            
+            for span in line.get("spans", []):
+                text = span.get("text", "").strip()
+                if not text:
+                    continue
+                
+                # Get formatting
+                bold, italic = font_style_flags(span.get("font", ""))
+                size = span.get("size", 12)
+                color = span.get("color", 0)
+                
+                # Documents repeat a handful of (size, color) pairs, so the
+                # heading/style decision is cached per pair
+                tag, style_attr = resolve_span_format(size, color)
+                
+                # Escape HTML
+                text_escaped = escape(text)
+                
+                # Apply formatting
+                if bold:
+                    text_escaped = f"<strong>{text_escaped}</strong>"
+                if italic:
+                    text_escaped = f"<em>{text_escaped}</em>"
+                
+                # Check for list indicators
+                if text.startswith(('•', '-', '*', '●', '○', '▪', '◆')):
+                    line_html = f"<li>{text_escaped.lstrip('•-*●○▪◆ ')}</li>"
+                    break
+                elif len(text) > 0 and text[0].isdigit() and '.' in text[:5]:
+                    # Numbered list
+                    clean_text = '.'.join(text.split('.')[1:]).strip()
+                    line_html = f"<li>{escape(clean_text)}</li>"
+                    break
+                else:
+                    if tag == "span":
+                        line_html += f"<{tag}{style_attr}>{text_escaped}</{tag}> "
+                    else:
+                        line_html = f"<{tag}{style_attr}>{text_escaped}</{tag}>"
+            
+            if line_html:
+                block_html += line_html + "\n"
+        
+        if block_html.strip():
+            text_blocks_data.append({
+                'html': block_html,
+                'y_position': block_bbox[1],
+                'bbox': block_bbox
+            })
+    
+    # Step 4: Wrap text blocks and serialize tables, keyed by Y position
+    content = []
+    
+    for text_block in text_blocks_data:
+        # Wrap text in appropriate container
+        text_html = text_block['html']
+        if "<li>" in text_html:
+            if text_html.count("<li>") > 1:
+                # Multiple list items
+                first_li = text_html[text_html.find("<li>"):text_html.find("</li>")]
+                if any(c.isdigit() for c in first_li[:10]):
+                    text_html = f"<ol>\n{text_html}</ol>\n"
+                else:
+                    text_html = f"<ul>\n{text_html}</ul>\n"
+            else:
+                text_html = f"<ul>\n{text_html}</ul>\n"
+        elif "<h" not in text_html:
+            text_html = f"<p>{text_html.strip()}</p>\n"
+        content.append((text_block['y_position'], text_html))
+    
+    # Tables - already formatted
+    for table_info in tables_data:
+        row_htmls = []
+        for row_idx, row in enumerate(table_info['data']):
+            tag = 'th' if row_idx == 0 else 'td'
+            cells_html = []
+            for cell in row:
+                # pdfplumber cells are almost always str already
+                cell_text = cell.strip() if isinstance(cell, str) else (_str(cell).strip() if cell else '')
+                cells_html.append(f"<{tag}>{_esc(cell_text)}</{tag}>\n")
+            row_htmls.append(f"<tr>\n{''.join(cells_html)}</tr>\n")
+        
+        table_html = f"<table>\n<thead>\n{row_htmls[0]}</thead>\n<tbody>\n{''.join(row_htmls[1:])}</tbody>\n</table>\n"
+        
+        content.append((table_info['y_position'], table_html))
+    
+    return content, images_data
+
+# Per-process PDF handle for the pdf_to_html worker pool
+html_worker_pdf = None
+
+def init_html_worker(pdf_bytes):
+    """Open the shared PDF bytes once per worker process"""
+    global html_worker_pdf
+    import fitz
+    
+    html_worker_pdf = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+def render_html_page(page_num):
+    """Worker entry point: extract one page with this process's PDF handle"""
+    return extract_html_page(html_worker_pdf, page_num)
 
 def pdf_to_html(input_path, output_path):
     """Convert PDF to responsive HTML with images, proper formatting, and mobile support"""
-    import pdfplumber
-    import fitz  # PyMuPDF for images and detailed formatting
+    import fitz  # PyMuPDF for tables, images and detailed formatting
     import os
-    from html import escape
     
     # Create directory for images
     output_dir = os.path.dirname(output_path)
@@ -1663,7 +2207,7 @@ def pdf_to_html(input_path, output_path):
     os.makedirs(images_dir, exist_ok=True)
     
     # Start HTML with responsive styling
-    html_content = """<!DOCTYPE html>
+    html_head = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1845,73 +2389,52 @@ def pdf_to_html(input_path, output_path):
 <body>
 """
     
-    # Open PDF with both libraries
-    pdf_plumber = pdfplumber.open(input_path)
-    pdf_fitz = fitz.open(input_path)
-    
     image_counter = 0
     
-    for page_num in range(len(pdf_fitz)):
-        page_plumber = pdf_plumber.pages[page_num]
-        page_fitz = pdf_fitz[page_num]
-        
-        # Step 1: Extract tables with their bounding boxes using pdfplumber
-        table_settings = {
-            "vertical_strategy": "lines",
-            "horizontal_strategy": "lines",
-            "explicit_vertical_lines": [],
-            "explicit_horizontal_lines": [],
-            "snap_tolerance": 3,
-            "join_tolerance": 3,
-            "edge_min_length": 3,
-            "min_words_vertical": 3,
-            "min_words_horizontal": 1,
-            "intersection_tolerance": 3,
-        }
+    # Pages are written in order as they finish, so only a bounded window of
+    # extracted pages is held in memory
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out, fitz.open(input_path) as pdf_fitz:
+        out.write(html_head)
+        page_count = len(pdf_fitz)
+        
+        # Serial vs. worker-pool extraction is picked by converter_rules.json
+        rule = match_conversion_rule('pdf-to-html', page_count, os.path.getsize(input_path) / (1024 * 1024))
+        
+        if rule.get('mode') != 'processes' or IN_BATCH_WORKER:
+            # Too few pages to repay worker start-up, or --batch already has every core busy
+            html_pages = (extract_html_page(pdf_fitz, page_num) for page_num in range(page_count))
+            executor = None
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with open(input_path, 'rb') as f:
+                pdf_bytes = f.read()
+            
+            from collections import deque
+            
+            max_workers = min(os.cpu_count() or 1, rule.get('workers', 5))
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_html_worker,
+                                           initargs=(pdf_bytes,))
+            
+            def windowed_pages():
+                """Yield pages in order, submitting only a few ahead of the one being written"""
+                pending = deque()
+                for page_num in range(page_count):
+                    pending.append(executor.submit(render_html_page, page_num))
+                    # A slow page can only hold back this many finished ones
+                    if len(pending) >= max_workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            
+            html_pages = windowed_pages()
         
-        tables_data = []
         try:
-            tables = page_plumber.find_tables(table_settings)
-            for table_obj in tables:
-                table_bbox = table_obj.bbox  # (x0, top, x1, bottom)
-                extracted_table = table_obj.extract()
-                
-                # Validate table
-                if not extracted_table or len(extracted_table) < 2:
-                    continue
+            # Pages are extracted in parallel; image numbers are assigned here in page order
+            for content_items, page_images in html_pages:
+                all_content = list(content_items)
                 
-                # Count filled cells
-                filled_count = 0
-                total_count = 0
-                for row in extracted_table:
-                    for cell in row:
-                        total_count += 1
-                        if cell and str(cell).strip():
-                            filled_count += 1
-                
-                # Skip if less than 30% filled or too few cells
-                if total_count < 4 or (filled_count / total_count) < 0.3:
-                    continue
-                
-                tables_data.append({
-                    'bbox': table_bbox,
-                    'data': extracted_table,
-                    'y_position': table_bbox[1]  # top coordinate
-                })
-        except:
-            pass
-        
-        # Step 2: Extract images with positions
-        images_data = []
-        try:
-            image_list = page_fitz.get_images()
-            for img_index, img_info in enumerate(image_list):
-                try:
-                    xref = img_info[0]
-                    base_image = pdf_fitz.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
+                for y_position, image_bytes, image_ext in page_images:
                     # Save image
                     image_counter += 1
                     image_filename = f"image_{image_counter:03d}.{image_ext}"
@@ -1920,389 +2443,540 @@ def pdf_to_html(input_path, output_path):
                     with open(image_path, "wb") as img_file:
                         img_file.write(image_bytes)
                     
-                    # Get image position
-                    img_rects = page_fitz.get_image_rects(xref)
-                    if img_rects:
-                        rect = img_rects[0]
+                    # Images without a position on the page are saved but not placed
+                    if y_position is not None:
                         rel_path = f"{output_name}_images/{image_filename}"
-                        images_data.append({
-                            'bbox': rect,
-                            'path': rel_path,
-                            'y_position': rect.y0,
-                            'counter': image_counter
-                        })
-                except:
-                    pass
-        except:
-            pass
-        
-        # Step 3: Extract text blocks, excluding table areas
-        text_blocks_data = []
-        text_blocks = page_fitz.get_text("dict")
-        
-        for block in text_blocks.get("blocks", []):
-            if block.get("type") != 0:  # Skip non-text blocks
-                continue
-            
-            block_bbox = block.get("bbox")  # (x0, y0, x1, y1)
-            if not block_bbox:
-                continue
-            
-            # Check if this block overlaps with any table
-            is_in_table = False
-            for table_info in tables_data:
-                table_bbox = table_info['bbox']  # (x0, top, x1, bottom)
-                # Check overlap
-                if (block_bbox[0] < table_bbox[2] and block_bbox[2] > table_bbox[0] and
-                    block_bbox[1] < table_bbox[3] and block_bbox[3] > table_bbox[1]):
-                    is_in_table = True
-                    break
-            
-            if is_in_table:
-                continue  # Skip text that's part of a table
-            
-            # Process text block
-            block_html = ""
-            for line in block.get("lines", []):
-                line_html = ""
+                        all_content.append((y_position, f'<img src="{rel_path}" alt="Image {image_counter}" loading="lazy">\n'))
                 
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    if not text:
-                        continue
-                    
-                    # Get formatting
-                    font = span.get("font", "").lower()
-                    size = span.get("size", 12)
-                    color = span.get("color", 0)
-                    
-                    # Detect heading based on size
-                    if size > 20:
-                        tag = "h1"
-                    elif size > 16:
-                        tag = "h2"
-                    elif size > 14:
-                        tag = "h3"
-                    else:
-                        tag = "span"
-                    
-                    # Build style
-                    style_parts = []
-                    if size != 12:
-                        style_parts.append(f"font-size: {size}pt")
-                    
-                    if color != 0:
-                        r = (color >> 16) & 255
-                        g = (color >> 8) & 255
-                        b = color & 255
-                        style_parts.append(f"color: rgb({r}, {g}, {b})")
-                    
-                    style_str = "; ".join(style_parts)
-                    style_attr = f' style="{style_str}"' if style_str else ""
-                    
-                    # Escape HTML
-                    text_escaped = escape(text)
-                    
-                    # Apply formatting
-                    if "bold" in font:
-                        text_escaped = f"<strong>{text_escaped}</strong>"
-                    if "italic" in font or "oblique" in font:
-                        text_escaped = f"<em>{text_escaped}</em>"
-                    
-                    # Check for list indicators
-                    if text.startswith(('•', '-', '*', '●', '○', '▪', '◆')):
-                        line_html = f"<li>{text_escaped.lstrip('•-*●○▪◆ ')}</li>"
-                        break
-                    elif len(text) > 0 and text[0].isdigit() and '.' in text[:5]:
-                        # Numbered list
-                        clean_text = '.'.join(text.split('.')[1:]).strip()
-                        line_html = f"<li>{escape(clean_text)}</li>"
-                        break
-                    else:
-                        if tag == "span":
-                            line_html += f"<{tag}{style_attr}>{text_escaped}</{tag}> "
-                        else:
-                            line_html = f"<{tag}{style_attr}>{text_escaped}</{tag}>"
-                
-                if line_html:
-                    block_html += line_html + "\n"
-            
-            if block_html.strip():
-                text_blocks_data.append({
-                    'html': block_html,
-                    'y_position': block_bbox[1],
-                    'bbox': block_bbox
-                })
-        
-        # Step 4: Merge and sort all content by Y position
-        all_content = []
-        
-        # Add text blocks
-        for text_block in text_blocks_data:
-            all_content.append({
-                'type': 'text',
-                'y_position': text_block['y_position'],
-                'html': text_block['html']
-            })
-        
-        # Add tables
-        for table_info in tables_data:
-            table_html = "<table>\n<thead>\n<tr>\n"
-            
-            # Header row
-            for cell in table_info['data'][0]:
-                cell_text = str(cell).strip() if cell else ''
-                table_html += f"<th>{escape(cell_text)}</th>\n"
-            table_html += "</tr>\n</thead>\n<tbody>\n"
-            
-            # Data rows
-            for row in table_info['data'][1:]:
-                table_html += "<tr>\n"
-                for cell in row:
-                    cell_text = str(cell).strip() if cell else ''
-                    table_html += f"<td>{escape(cell_text)}</td>\n"
-                table_html += "</tr>\n"
-            
-            table_html += "</tbody>\n</table>\n"
-            
-            all_content.append({
-                'type': 'table',
-                'y_position': table_info['y_position'],
-                'html': table_html
-            })
-        
-        # Add images
-        for img_info in images_data:
-            img_html = f'<img src="{img_info["path"]}" alt="Image {img_info["counter"]}" loading="lazy">\n'
-            all_content.append({
-                'type': 'image',
-                'y_position': img_info['y_position'],
-                'html': img_html
-            })
-        
-        # Sort by Y position (top to bottom)
-        all_content.sort(key=lambda x: x['y_position'])
-        
-        # Step 5: Render content in order
-        for item in all_content:
-            if item['type'] == 'text':
-                # Wrap text in appropriate container
-                text_html = item['html']
-                if "<li>" in text_html:
-                    if text_html.count("<li>") > 1:
-                        # Multiple list items
-                        first_li = text_html[text_html.find("<li>"):text_html.find("</li>")]
-                        if any(c.isdigit() for c in first_li[:10]):
-                            html_content += f"<ol>\n{text_html}</ol>\n"
-                        else:
-                            html_content += f"<ul>\n{text_html}</ul>\n"
-                    else:
-                        html_content += f"<ul>\n{text_html}</ul>\n"
-                elif "<h" in text_html:
-                    html_content += text_html
-                else:
-                    html_content += f"<p>{text_html.strip()}</p>\n"
-            else:
-                # Table or image - already formatted
-                html_content += item['html']
-    
-    pdf_plumber.close()
-    pdf_fitz.close()
-    
-    # Close HTML
-    html_content += """
+                # Sort by Y position (top to bottom)
+                all_content.sort(key=itemgetter(0))
+                out.write(''.join([item_html for _, item_html in all_content]))
+        except BaseException:
+            if executor is not None:
+                # Don't wait for the rest of the document once the output has failed
+                executor.shutdown(cancel_futures=True)
+            raise
+        
+        if executor is not None:
+            executor.shutdown()
+        
+        # Close HTML
+        out.write("""
 </body>
-</html>"""
-    
-    # Write HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+</html>""")
     
     print(f"SUCCESS: Converted PDF to HTML: {output_path}")
     if image_counter > 0:
         print(f"  Extracted {image_counter} image(s) to: {images_dir}")
 
-def pdf_to_ppt(input_path, output_path):
+def extract_ppt_page(pdf_fitz, pdf_plumber, page_num):
+    """Collect what pdf_to_ppt needs from one page as plain, picklable data"""
+    from PIL import Image
+    import numpy as np
+    import io
+    
+    page_fitz = pdf_fitz[page_num]
+    
+    # What a damaged page can raise; Ctrl-C, MemoryError and real bugs propagate
+    page_errors = PPT_PAGE_ERRORS + (pdf_fitz_error(),)
+    
+    page_data = {
+        'width': page_fitz.rect.width,
+        'height': page_fitz.rect.height,
+        'background': None,
+        'images': [],
+        'text_blocks': [],
+        'spans': None,
+        'tables': [],
+    }
+    
+    # Extract background color if present
+    try:
+        # Get page background/canvas color
+        pixmap = page_fitz.get_pixmap(alpha=False)
+        if pixmap.n >= 3:  # RGB or RGBA
+            # Sample background color from corners
+            img_data = pixmap.tobytes("ppm")
+            img = Image.open(io.BytesIO(img_data))
+            # Get color from top-left corner (likely background)
+            bg_color = img.getpixel((0, 0))
+            if bg_color != (255, 255, 255):  # Not white
+                page_data['background'] = bg_color[:3]
+    except page_errors:
+        pass  # Keep default white background
+    
+    # Image locations; the bytes are extracted once per xref by the caller
+    try:
+        for img_info in page_fitz.get_images():
+            xref = img_info[0]
+            rects = [(r.x0, r.y0, r.width, r.height) for r in page_fitz.get_image_rects(xref)]
+            page_data['images'].append((xref, rects))
+    except page_errors:
+        pass  # Continue if image extraction fails
+    
+    # Text blocks; their spans are flattened into one structured array per page
+    try:
+        text_instances = page_fitz.get_text("dict")
+    except page_errors:
+        text_instances = {}  # Unreadable text layer; the slide keeps images and tables
+    
+    text_blocks = [block for block in text_instances.get("blocks", []) if block.get("type") == 0 and block.get("bbox")]
+    page_data['text_blocks'] = [{'bbox': tuple(block["bbox"]), 'line_count': len(block.get("lines", []))}
+                                for block in text_blocks]
+    
+    # One flat pass over every span on the page
+    span_records = [
+        (block_idx, line_idx, span.get("text", ""), span.get("font", ""), span.get("size", 12), span.get("color", 0))
+        for block_idx, block in enumerate(text_blocks)
+        for line_idx, line in enumerate(block.get("lines", []))
+        for span in line.get("spans", [])
+    ]
+    
+    spans = np.array(span_records, dtype=[('block', 'i4'), ('line', 'i4'), ('text', 'O'),
+                                          ('font', 'O'), ('size', 'f8'), ('color', 'u4')])
+    
+    # Detect bold/italic from font names for the whole page at once
+    fonts = np.char.lower(spans['font'].astype(str))
+    page_data['spans'] = {
+        'block': spans['block'],
+        'line': spans['line'],
+        'text': spans['text'],
+        'size': spans['size'],
+        'color': spans['color'],
+        'bold': np.char.find(fonts, 'bold') >= 0,
+        'italic': (np.char.find(fonts, 'italic') >= 0) | (np.char.find(fonts, 'oblique') >= 0),
+    }
+    
+    # Tables - PyMuPDF's own finder unless pdfplumber was asked for
+    try:
+        if pdf_plumber is None:
+            page_data['tables'] = [table.extract() for table in page_fitz.find_tables().tables]
+        else:
+            page_data['tables'] = run_page(page_tables, pdf_plumber.pages[page_num], page_num) or []
+    except page_errors + (pdf_table_error(),):
+        pass  # Continue if table extraction fails
+    
+    return page_data
+
+# Size-based routing used when converter_rules.json is missing or unreadable.
+# Page/size ranges are inclusive; null means unbounded. The first matching rule wins.
+DEFAULT_CONVERSION_RULES = {
+    'pdf-to-ppt': [
+        {'pages': [0, 3], 'mode': 'serial'},
+        {'pages': [4, None], 'mode': 'processes', 'workers': 5}
+    ],
+    'pdf-to-html': [
+        {'pages': [0, 3], 'mode': 'serial'},
+        {'pages': [4, None], 'mode': 'processes', 'workers': 5}
+    ]
+}
+
+def clean_conversion_rule(rule):
+    """A converter_rules.json rule with usable values, or None to drop a malformed one"""
+    def valid_bounds(bounds):
+        return bounds is None or (
+            isinstance(bounds, list) and len(bounds) == 2
+            and all(bound is None or (isinstance(bound, (int, float)) and not isinstance(bound, bool))
+                    for bound in bounds))
+    
+    if not isinstance(rule, dict) or not (valid_bounds(rule.get('pages')) and valid_bounds(rule.get('sizeMB'))):
+        return None
+    
+    # Worker counts feed min() and ProcessPoolExecutor, so anything but a positive int uses the default
+    workers = rule.get('workers', 5)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        rule = dict(rule, workers=5)
+    return rule
+
+@lru_cache(maxsize=1)
+def load_conversion_rules():
+    """Load converter_rules.json from next to the converter, once per process"""
+    import json
+    
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    
+    try:
+        with open(os.path.join(base_path, 'converter_rules.json'), encoding='utf-8') as f:
+            rules = json.load(f)
+    except (OSError, ValueError):
+        return DEFAULT_CONVERSION_RULES
+    
+    if not isinstance(rules, dict):
+        return DEFAULT_CONVERSION_RULES
+    return {conversion_type: [rule for rule in map(clean_conversion_rule, type_rules) if rule is not None]
+            for conversion_type, type_rules in rules.items() if isinstance(type_rules, list)}
+
+def match_conversion_rule(conversion_type, page_count, size_mb):
+    """First rule for conversion_type whose page and size ranges contain the document"""
+    def in_range(value, bounds):
+        if bounds is None:
+            return True
+        low, high = bounds
+        return (low is None or value >= low) and (high is None or value <= high)
+    
+    rules = load_conversion_rules().get(conversion_type) or DEFAULT_CONVERSION_RULES[conversion_type]
+    for rule in rules:
+        if in_range(page_count, rule.get('pages')) and in_range(size_mb, rule.get('sizeMB')):
+            return rule
+    return rules[-1]
+
+@lru_cache(maxsize=1)
+def pptx_template_bytes():
+    """python-pptx's default template, read from disk once per process"""
+    import pptx
+    
+    with open(os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx'), 'rb') as f:
+        return f.read()
+
+# Exceptions extract_ppt_page treats as "this part of the page is unreadable"
+PPT_PAGE_ERRORS = (RuntimeError, ValueError, KeyError, IndexError, TypeError, OSError)
+
+def pdf_fitz_error():
+    """Base class of errors raised from inside MuPDF"""
+    import fitz
+    return fitz.mupdf.FzErrorBase
+
+def pdf_table_error():
+    """Base class of pdfminer parse errors surfaced by pdfplumber"""
+    try:
+        from pdfminer.psexceptions import PSException
+    except ImportError:
+        return RuntimeError
+    return PSException
+
+@lru_cache(maxsize=4096)
+def rgb_from_int(color):
+    """python-pptx RGBColor for a PyMuPDF integer color, shared between runs"""
+    from pptx.dml.color import RGBColor
+    return RGBColor((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+# Per-process PDF handles for the pdf_to_ppt worker pool
+ppt_worker_docs = None
+
+def init_ppt_worker(pdf_bytes, accurate_tables):
+    """Open the shared PDF bytes once per worker process"""
+    global ppt_worker_docs
+    import fitz
+    import io
+    
+    pdf_plumber = open_pdfplumber(io.BytesIO(pdf_bytes)) if accurate_tables else None
+    ppt_worker_docs = (fitz.open(stream=pdf_bytes, filetype="pdf"), pdf_plumber)
+
+def render_ppt_page(page_num):
+    """Worker entry point: extract one page with this process's PDF handles"""
+    pdf_fitz, pdf_plumber = ppt_worker_docs
+    return extract_ppt_page(pdf_fitz, pdf_plumber, page_num)
+
+def pdf_to_ppt(input_path, output_path, accurate_tables=False):
     """Convert PDF to PowerPoint preserving formatting, images, colors, and layout"""
     from pptx import Presentation
     from pptx.util import Inches, Pt
     from pptx.enum.text import PP_ALIGN
     from pptx.dml.color import RGBColor
-    import pdfplumber
-    from PIL import Image
+    from concurrent.futures import ProcessPoolExecutor
+    from contextlib import ExitStack
     import io
+    import os
     import fitz  # PyMuPDF for better image and color extraction
     
-    prs = Presentation()
+    prs = Presentation(io.BytesIO(pptx_template_bytes()))
+    blank_layout = prs.slide_layouts[6]
     
-    # Open PDF with both libraries for comprehensive extraction
-    pdf_plumber = pdfplumber.open(input_path)
-    pdf_fitz = fitz.open(input_path)
+    # Table styling lengths and colours are the same on every slide
+    table_left = Inches(0.5)
+    table_top = Inches(1)
+    header_fill = RGBColor(54, 96, 146)
+    header_text = RGBColor(255, 255, 255)
+    header_size = Pt(11)
+    body_size = Pt(10)
     
-    for page_num in range(len(pdf_fitz)):
-        page_plumber = pdf_plumber.pages[page_num]
-        page_fitz = pdf_fitz[page_num]
-        
-        # Get page dimensions
-        page_width = page_fitz.rect.width
-        page_height = page_fitz.rect.height
+    # Extracted image bytes by xref; logos and backgrounds repeat across pages
+    image_cache = {}
+    
+    # Font sizes cluster on a few values, so their Pt lengths are reused
+    pt_cache = {}
+    
+    page_errors = PPT_PAGE_ERRORS + (pdf_fitz_error(),)
+    
+    # Local alias for the per-cell loop
+    _str = str
+    
+    def format_cell(cell, text, size_pt, color_rgb=None, bold=False, fill_rgb=None):
+        """Write a table cell's text and style its runs"""
+        if fill_rgb is not None:
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = fill_rgb
         
+        text_frame = cell.text_frame
+        text_frame.text = text
+        if not text:
+            return
+        
+        # Extracted cells are usually one line, i.e. a single paragraph with a single run
+        if '\n' in text:
+            runs = [run for paragraph in text_frame.paragraphs for run in paragraph.runs]
+        else:
+            runs = text_frame.paragraphs[0].runs
+        
+        for run in runs:
+            font = run.font
+            font.size = size_pt
+            if color_rgb is not None:
+                font.color.rgb = color_rgb
+            if bold:
+                font.bold = True
+    
+    def add_page_slide(page_data):
+        """Build one slide from extract_ppt_page output"""
         # Set slide dimensions to match PDF page (convert points to inches)
-        prs.slide_width = Inches(page_width / 72)
-        prs.slide_height = Inches(page_height / 72)
+        prs.slide_width = Inches(page_data['width'] / 72)
+        prs.slide_height = Inches(page_data['height'] / 72)
         
         # Create blank slide
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        
-        # Extract and set background color if present
-        try:
-            # Get page background/canvas color
-            pixmap = page_fitz.get_pixmap(alpha=False)
-            if pixmap.n >= 3:  # RGB or RGBA
-                # Sample background color from corners
-                img_data = pixmap.tobytes("ppm")
-                img = Image.open(io.BytesIO(img_data))
-                # Get color from top-left corner (likely background)
-                bg_color = img.getpixel((0, 0))
-                if bg_color != (255, 255, 255):  # Not white
-                    background = slide.background
-                    fill = background.fill
-                    fill.solid()
-                    fill.fore_color.rgb = RGBColor(bg_color[0], bg_color[1], bg_color[2])
-        except:
-            pass  # Keep default white background
-        
-        # Extract images from PDF and add to slide
-        try:
-            image_list = page_fitz.get_images()
-            for img_index, img_info in enumerate(image_list):
-                xref = img_info[0]
-                base_image = pdf_fitz.extract_image(xref)
-                image_bytes = base_image["image"]
-                
-                # Get image location from page
-                img_instances = page_fitz.get_image_rects(xref)
-                for img_rect in img_instances:
-                    # Convert coordinates from points to inches
-                    left = Inches(img_rect.x0 / 72)
-                    top = Inches(img_rect.y0 / 72)
-                    width = Inches(img_rect.width / 72)
-                    height = Inches(img_rect.height / 72)
-                    
-                    # Save image temporarily
-                    img_stream = io.BytesIO(image_bytes)
-                    try:
-                        slide.shapes.add_picture(img_stream, left, top, width, height)
-                    except:
-                        pass  # Skip if image format not supported
-        except:
-            pass  # Continue if image extraction fails
-        
-        # Extract text with formatting
-        text_instances = page_fitz.get_text("dict")
-        
-        for block in text_instances.get("blocks", []):
-            if block.get("type") == 0:  # Text block
-                bbox = block.get("bbox")
-                if not bbox:
-                    continue
-                
+        slide = prs.slides.add_slide(blank_layout)
+        
+        # Set background color if present
+        bg_color = page_data['background']
+        if bg_color:
+            fill = slide.background.fill
+            fill.solid()
+            fill.fore_color.rgb = RGBColor(*bg_color)
+        
+        # Add images from PDF to slide
+        for xref, img_rects in page_data['images']:
+            image_bytes = image_cache.get(xref)
+            if image_bytes is None:
+                try:
+                    image_bytes = image_cache[xref] = pdf_fitz.extract_image(xref)["image"]
+                except page_errors:
+                    continue  # Skip images MuPDF cannot extract
+            
+            for x0, y0, rect_width, rect_height in img_rects:
                 # Convert coordinates from points to inches
-                left = Inches(bbox[0] / 72)
-                top = Inches(bbox[1] / 72)
-                width = Inches((bbox[2] - bbox[0]) / 72)
-                height = Inches((bbox[3] - bbox[1]) / 72)
+                left = Inches(x0 / 72)
+                top = Inches(y0 / 72)
+                width = Inches(rect_width / 72)
+                height = Inches(rect_height / 72)
                 
-                # Create textbox
+                # Save image temporarily
+                img_stream = io.BytesIO(image_bytes)
                 try:
-                    textbox = slide.shapes.add_textbox(left, top, width, height)
-                    text_frame = textbox.text_frame
-                    text_frame.word_wrap = True
-                    text_frame.clear()  # Clear default paragraph
+                    slide.shapes.add_picture(img_stream, left, top, width, height)
+                except PPT_PAGE_ERRORS:
+                    pass  # Skip if image format not supported
+        
+        # Group the page's span rows by the text block they belong to
+        spans = page_data['spans']
+        span_rows = zip(*(spans[key].tolist() for key in ('block', 'line', 'text', 'size', 'color', 'bold', 'italic')))
+        spans_by_block = {block_idx: list(rows) for block_idx, rows in groupby(span_rows, key=itemgetter(0))}
+        
+        # Add text with formatting
+        for block_idx, block in enumerate(page_data['text_blocks']):
+            bbox = block['bbox']
+            
+            # Convert coordinates from points to inches
+            left = Inches(bbox[0] / 72)
+            top = Inches(bbox[1] / 72)
+            width = Inches((bbox[2] - bbox[0]) / 72)
+            height = Inches((bbox[3] - bbox[1]) / 72)
+            
+            # Create textbox
+            try:
+                textbox = slide.shapes.add_textbox(left, top, width, height)
+                text_frame = textbox.text_frame
+                text_frame.word_wrap = True
+                text_frame.clear()  # Clear default paragraph
+                
+                # One paragraph per line in the block
+                paragraphs = list(text_frame.paragraphs[:1]) + [text_frame.add_paragraph() for _ in range(block['line_count'] - 1)]
+                
+                # Process each span (text segment with same formatting)
+                for _, line_idx, text, size, color, bold, italic in spans_by_block.get(block_idx, ()):
+                    if not text.strip():
+                        continue
                     
-                    # Process each line in the block
-                    for line_idx, line in enumerate(block.get("lines", [])):
-                        p = text_frame.add_paragraph() if line_idx > 0 else text_frame.paragraphs[0]
-                        
-                        # Process each span (text segment with same formatting)
-                        for span in line.get("spans", []):
-                            text = span.get("text", "")
-                            if not text.strip():
-                                continue
-                            
-                            run = p.add_run()
-                            run.text = text
-                            
-                            # Apply font formatting
-                            font = span.get("font", "")
-                            size = span.get("size", 12)
-                            color = span.get("color", 0)  # Integer color value
-                            
-                            # Set font size (convert to points)
-                            run.font.size = Pt(size)
-                            
-                            # Set font color (convert integer to RGB)
-                            if color != 0:
-                                r = (color >> 16) & 255
-                                g = (color >> 8) & 255
-                                b = color & 255
-                                run.font.color.rgb = RGBColor(r, g, b)
-                            
-                            # Detect bold/italic from font name
-                            if "bold" in font.lower():
-                                run.font.bold = True
-                            if "italic" in font.lower() or "oblique" in font.lower():
-                                run.font.italic = True
-                except:
-                    pass  # Skip problematic text blocks
-        
-        # Extract and add tables with formatting
-        try:
-            tables = page_plumber.extract_tables()
-            if tables:
-                for table_data in tables:
-                    if len(table_data) > 0 and len(table_data[0]) > 0:
-                        rows = min(len(table_data), 30)
-                        cols = min(len(table_data[0]), 15)
-                        
-                        # Calculate table position (try to match PDF layout)
-                        left = Inches(0.5)
-                        top = Inches(1)
-                        width = Inches(min(9, prs.slide_width.inches - 1))
-                        height = Inches(min(5, prs.slide_height.inches - 2))
-                        
-                        shape = slide.shapes.add_table(rows, cols, left, top, width, height)
-                        ppt_table = shape.table
-                        
-                        # Fill table data with formatting
-                        for i, row in enumerate(table_data[:rows]):
-                            for j, cell_value in enumerate(row[:cols]):
-                                cell = ppt_table.cell(i, j)
-                                cell.text = str(cell_value) if cell_value else ''
-                                
+                    run = paragraphs[line_idx].add_run()
+                    run.text = text
+                    
+                    # Set font size (convert to points)
+                    size_pt = pt_cache.get(size)
+                    if size_pt is None:
+                        size_pt = pt_cache[size] = Pt(size)
+                    run.font.size = size_pt
+                    
+                    # Set font color (convert integer to RGB)
+                    if color:
+                        run.font.color.rgb = rgb_from_int(color)
+                    
+                    # Bold/italic were detected from the font name by extract_ppt_page
+                    if bold:
+                        run.font.bold = True
+                    if italic:
+                        run.font.italic = True
+            except PPT_PAGE_ERRORS:
+                pass  # Skip problematic text blocks (e.g. text that is not valid XML)
+        
+        # Add tables with formatting
+        if page_data['tables']:
+            # Table box depends only on this page's slide size
+            table_width = Inches(min(9, prs.slide_width.inches - 1))
+            table_height = Inches(min(5, prs.slide_height.inches - 2))
+        
+        for table_data in page_data['tables']:
+            try:
+                if len(table_data) > 0 and len(table_data[0]) > 0:
+                    rows = min(len(table_data), 30)
+                    cols = min(len(table_data[0]), 15)
+                    
+                    shape = slide.shapes.add_table(rows, cols, table_left, table_top, table_width, table_height)
+                    ppt_table = shape.table
+                    
+                    # Fill table data with formatting
+                    for i, row in enumerate(table_data[:rows]):
+                        for j, cell_value in enumerate(row[:cols]):
+                            # Extracted cells are already strings; only None and numbers need converting
+                            if isinstance(cell_value, _str):
+                                cell_text = cell_value
+                            else:
+                                cell_text = _str(cell_value) if cell_value else ''
+                            if i == 0:
                                 # Format header row
-                                if i == 0:
-                                    cell.fill.solid()
-                                    cell.fill.fore_color.rgb = RGBColor(54, 96, 146)
-                                    for paragraph in cell.text_frame.paragraphs:
-                                        for run in paragraph.runs:
-                                            run.font.color.rgb = RGBColor(255, 255, 255)
-                                            run.font.bold = True
-                                            run.font.size = Pt(11)
-                                else:
-                                    # Regular cells
-                                    for paragraph in cell.text_frame.paragraphs:
-                                        for run in paragraph.runs:
-                                            run.font.size = Pt(10)
-        except:
-            pass  # Continue if table extraction fails
+                                format_cell(ppt_table.cell(i, j), cell_text, header_size,
+                                            color_rgb=header_text, bold=True, fill_rgb=header_fill)
+                            else:
+                                # Regular cells
+                                format_cell(ppt_table.cell(i, j), cell_text, body_size)
+            except PPT_PAGE_ERRORS:
+                pass  # Skip tables whose cells cannot be written
+    
+    with ExitStack() as stack:
+        # PyMuPDF stays open here for image bytes; page extraction may run in workers
+        pdf_fitz = stack.enter_context(fitz.open(input_path))
+        page_count = len(pdf_fitz)
+        
+        # Serial vs. worker-pool extraction is picked by converter_rules.json
+        rule = match_conversion_rule('pdf-to-ppt', page_count, os.path.getsize(input_path) / (1024 * 1024))
+        
+        if rule.get('mode') != 'processes' or IN_BATCH_WORKER:
+            # Too few pages to repay worker start-up, or --batch already has every core busy
+            pdf_plumber = shared_pdf(input_path) if accurate_tables else None
+            
+            for page_num in range(page_count):
+                add_page_slide(extract_ppt_page(pdf_fitz, pdf_plumber, page_num))
+        else:
+            # Pages are extracted in parallel; python-pptx objects are built here in page order
+            with open(input_path, 'rb') as f:
+                pdf_bytes = f.read()
+            
+            max_workers = min(os.cpu_count() or 1, rule.get('workers', 5))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_ppt_worker,
+                                     initargs=(pdf_bytes, accurate_tables)) as executor:
+                for page_data in executor.map(render_ppt_page, range(page_count)):
+                    add_page_slide(page_data)
     
-    pdf_plumber.close()
-    pdf_fitz.close()
+    # The PDF is closed and its image bytes dropped before python-pptx serializes
+    image_cache.clear()
     
     prs.save(output_path)
     print(f"SUCCESS: Converted PDF to PowerPoint: {output_path}")
 
+# Map format to Ghostscript device
+GS_DEVICES = {
+    'png': 'png16m',      # 24-bit RGB PNG
+    'jpeg': 'jpeg',       # JPEG
+    'jpg': 'jpeg',
+    'tiff': 'tiff24nc',   # 24-bit RGB TIFF
+    'tif': 'tiff24nc',
+    'ppm': 'ppmraw'       # Uncompressed RGB, encoded afterwards by Pillow
+}
+
+# Pillow format names for the PDFium path
+PIL_FORMATS = {
+    'png': 'PNG',
+    'jpeg': 'JPEG',
+    'jpg': 'JPEG',
+    'tiff': 'TIFF',
+    'tif': 'TIFF'
+}
+
+# Above this many pages Ghostscript's banded renderer wins over PDFium
+PDFIUM_MAX_PAGES = 50
+
+def image_extension(format):
+    """File extension used for images of the given format"""
+    ext = format.lower()
+    if ext == 'jpg':
+        ext = 'jpeg'
+    return ext
+
+def build_gs_args(format, dpi, quality):
+    """Ghostscript command line up to (not including) the output file and inputs"""
+    gs_args = [
+        GHOSTSCRIPT_PATH,
+        '-dNOPAUSE',
+        '-dBATCH',
+        '-dSAFER',
+        '-sDEVICE=' + GS_DEVICES.get(format.lower(), 'png16m'),
+        f'-r{dpi}',           # Set resolution
+        '-dTextAlphaBits=4',  # Anti-aliasing for text
+        '-dGraphicsAlphaBits=4',  # Anti-aliasing for graphics
+        f'-dNumRenderingThreads={min(os.cpu_count() or 1, 8)}',  # Rasterize bands in parallel
+        '-dBandHeight=64',
+    ]
+    
+    # Add JPEG quality if applicable
+    if format.lower() in ['jpeg', 'jpg']:
+        gs_args.append(f'-dJPEGQ={quality}')
+    
+    return gs_args
+
+def save_image(image, output_file, format, quality):
+    """Encode a Pillow image in the requested output format"""
+    pil_format = PIL_FORMATS.get(format.lower(), 'PNG')
+    if pil_format == 'JPEG':
+        image.save(output_file, pil_format, quality=quality)
+    elif pil_format == 'PNG':
+        image.save(output_file, pil_format, compress_level=1)  # Speed over size
+    else:
+        image.save(output_file, pil_format)
+
+def encode_ppm(ppm_path, output_file, format, quality):
+    """Encode one Ghostscript PPM page and delete the intermediate"""
+    from PIL import Image
+    
+    with Image.open(ppm_path) as image:
+        save_image(image, output_file, format, quality)
+    os.remove(ppm_path)
+
+def pdfium_render(pdf, output_pattern, format, dpi, quality, single_file=False):
+    """Rasterize an open pypdfium2 document to files named like Ghostscript's %d pattern"""
+    from concurrent.futures import ThreadPoolExecutor
+    from collections import deque
+    
+    page_count = 1 if single_file else len(pdf)
+    max_workers = os.cpu_count() or 1
+    
+    # PDFium is not thread-safe, so pages render here and only the encoding runs in threads
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for page_num in range(page_count):
+            page = pdf[page_num]
+            image = page.render(scale=dpi / 72).to_pil()
+            page.close()
+            
+            output_file = output_pattern if single_file else output_pattern % (page_num + 1)
+            pending.append(executor.submit(save_image, image, output_file, format, quality))
+            
+            # Bound how many rendered pages wait in memory for the encoder
+            if len(pending) >= max_workers * 2:
+                pending.popleft().result()
+        
+        for future in pending:
+            future.result()
+
 def pdf_to_images(input_path, output_folder, format='png', dpi=150, quality=90):
     """
     Convert PDF pages to images using Ghostscript for high quality output
@@ -2314,8 +2988,9 @@ def pdf_to_images(input_path, output_folder, format='png', dpi=150, quality=90):
         dpi: Resolution in DPI (default: 150)
         quality: JPEG quality 1-100 (default: 90)
     """
-    if not GHOSTSCRIPT_PATH or not os.path.exists(GHOSTSCRIPT_PATH):
-        raise Exception("Ghostscript not found. PDF to image conversion requires Ghostscript.")
+    from concurrent.futures import ThreadPoolExecutor
+    import tempfile
+    import io
     
     # Check if output_folder is a directory or single file path
     is_single_file = output_folder.lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.tif'))
@@ -2323,74 +2998,132 @@ def pdf_to_images(input_path, output_folder, format='png', dpi=150, quality=90):
     if is_single_file:
         # Single file output
         output_path = output_folder
-        output_folder = os.path.dirname(output_path)
-        output_basename = os.path.splitext(os.path.basename(output_path))[0]
     else:
         # Directory output
         os.makedirs(output_folder, exist_ok=True)
         output_basename = os.path.splitext(os.path.basename(input_path))[0]
     
-    # Map format to Ghostscript device
-    device_map = {
-        'png': 'png16m',      # 24-bit RGB PNG
-        'jpeg': 'jpeg',       # JPEG
-        'jpg': 'jpeg',
-        'tiff': 'tiff24nc',   # 24-bit RGB TIFF
-        'tif': 'tiff24nc'
-    }
+    ext = image_extension(format)
     
-    device = device_map.get(format.lower(), 'png16m')
-    ext = format.lower()
-    if ext == 'jpg':
-        ext = 'jpeg'
+    if is_single_file:
+        output_pattern = output_path
+    else:
+        # Output file pattern; a literal % in the folder or file name is doubled
+        # for both Python's % formatting and Ghostscript's OutputFile template
+        output_prefix = os.path.join(output_folder, output_basename).replace('%', '%%')
+        output_pattern = f"{output_prefix}-%d.{ext}"
     
-    # Output file pattern
-    output_pattern = os.path.join(output_folder, f"{output_basename}-%d.{ext}")
+    # Small documents render faster in-process with PDFium than through a gs subprocess
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
     
-    # Build Ghostscript arguments
-    gs_args = [
-        GHOSTSCRIPT_PATH,
-        '-dNOPAUSE',
-        '-dBATCH',
-        '-dSAFER',
-        '-sDEVICE=' + device,
-        f'-r{dpi}',           # Set resolution
-        '-dTextAlphaBits=4',  # Anti-aliasing for text
-        '-dGraphicsAlphaBits=4',  # Anti-aliasing for graphics
-    ]
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(input_path)
+        try:
+            if len(pdf) <= PDFIUM_MAX_PAGES:
+                pdfium_render(pdf, output_pattern, format, dpi, quality, single_file=is_single_file)
+                print(f"SUCCESS: Converted PDF to {format.upper()} images: {output_folder if not is_single_file else output_path}")
+                return True
+        finally:
+            pdf.close()
     
-    # Add JPEG quality if applicable
-    if format.lower() in ['jpeg', 'jpg']:
-        gs_args.append(f'-dJPEGQ={quality}')
+    if not GHOSTSCRIPT_PATH or not os.path.exists(GHOSTSCRIPT_PATH):
+        raise Exception("Ghostscript not found. PDF to image conversion requires Ghostscript.")
+    
+    # PNG/JPEG compression is single-threaded inside gs, so those are rendered
+    # as raw PPM and encoded by Pillow across threads instead
+    encode_in_threads = PIL_FORMATS.get(format.lower()) in ('PNG', 'JPEG')
     
-    gs_args.extend([
-        f'-sOutputFile={output_pattern}',
-        input_path
-    ])
+    # Build Ghostscript arguments
+    gs_args = build_gs_args('ppm' if encode_in_threads else format, dpi, quality)
+    
+    if is_single_file:
+        # Only the first page is wanted, so gs renders just that straight to the target
+        gs_args += ['-dFirstPage=1', '-dLastPage=1']
+    
+    # A single PPM page is piped back on stdout; TIFF needs a seekable file
+    pipe_page = is_single_file and encode_in_threads
+    
+    ppm_dir = None
+    if pipe_page:
+        # Keep gs messages, including interpreter warnings on damaged files, out of the image stream
+        gs_args.extend(['-q', '-sstdout=%stderr'])
+        gs_output = '-'
+    elif encode_in_threads:
+        ppm_dir = tempfile.TemporaryDirectory()
+    elif is_single_file:
+        gs_output = output_path.replace('%', '%%')  # gs treats OutputFile as a template
+    else:
+        gs_output = output_pattern
     
     # Execute Ghostscript
     try:
-        result = subprocess.run(gs_args, capture_output=True, text=True, check=True)
-        
-        # If single file output, rename the first generated file
-        if is_single_file:
-            first_generated = os.path.join(output_folder, f"{output_basename}-1.{ext}")
-            if os.path.exists(first_generated):
-                os.rename(first_generated, output_path)
-                # Remove any additional pages if they exist
-                page_num = 2
+        if encode_in_threads and not pipe_page:
+            import time
+            
+            ppm_pattern = os.path.join(ppm_dir.name, 'page-%d.ppm')
+            
+            # Raw PPM pages are large, so each is encoded (and deleted) while gs
+            # is still rendering the rest of the document in the same run
+            with tempfile.TemporaryFile() as gs_stderr, \
+                    ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                process = subprocess.Popen(gs_args + [f'-sOutputFile={ppm_pattern}', input_path],
+                                           stdout=subprocess.DEVNULL, stderr=gs_stderr)
+                futures = []
+                next_page = 1
                 while True:
-                    next_page = os.path.join(output_folder, f"{output_basename}-{page_num}.{ext}")
-                    if os.path.exists(next_page):
-                        os.remove(next_page)
-                        page_num += 1
-                    else:
+                    finished = process.poll() is not None
+                    # gs only opens a page's file once the previous page is complete
+                    while (os.path.exists(ppm_pattern % (next_page + 1))
+                           or (finished and process.returncode == 0 and os.path.exists(ppm_pattern % next_page))):
+                        futures.append(executor.submit(encode_ppm, ppm_pattern % next_page,
+                                                       output_pattern % next_page, format, quality))
+                        next_page += 1
+                    if finished:
                         break
+                    time.sleep(0.02)
+                
+                if process.returncode:
+                    gs_stderr.seek(0)
+                    raise subprocess.CalledProcessError(process.returncode, gs_args, stderr=gs_stderr.read())
+                
+                for future in futures:
+                    future.result()
+        else:
+            result = subprocess.run(gs_args + [f'-sOutputFile={gs_output}', input_path],
+                                    capture_output=True, check=True)
+            
+            if pipe_page:
+                from PIL import Image
+                
+                with Image.open(io.BytesIO(result.stdout)) as image:
+                    save_image(image, output_path, format, quality)
         
         print(f"SUCCESS: Converted PDF to {format.upper()} images: {output_folder if not is_single_file else output_path}")
         return True
     except subprocess.CalledProcessError as e:
-        raise Exception(f"Ghostscript conversion failed: {e.stderr}")
+        raise Exception(f"Ghostscript conversion failed: {e.stderr.decode(errors='replace')}")
+    finally:
+        if ppm_dir is not None:
+            ppm_dir.cleanup()
+
+def pdf_to_images_batch(jobs):
+    """
+    Convert several PDFs to images, one render per file
+    
+    Args:
+        jobs: list of (input_path, output_folder, format, dpi, quality) tuples;
+              images are written as <input name>-<page>.<ext> in output_folder
+    """
+    # Chaining inputs through one gs process would need an OutputFile switch,
+    # which -dSAFER locks; gs start-up is small next to rendering anyway
+    for input_path, output_folder, format, dpi, quality in jobs:
+        pdf_to_images(input_path, output_folder, format, dpi, quality)
+    
+    print(f"SUCCESS: Converted {len(jobs)} PDF(s) to images")
+    return True
 
 def pdf_to_png(input_path, output_path):
     """Convert PDF to PNG using Ghostscript"""
@@ -2421,39 +3154,241 @@ CONVERSIONS = {
     'pdf-to-images': pdf_to_images,
 }
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage: converter.exe <conversion_type> <input_file> <output_file>")
-        print("\nAvailable conversions:")
-        for conv_type in CONVERSIONS.keys():
-            print(f"  - {conv_type}")
-        sys.exit(1)
+# Image conversions that accept a glob of PDFs and render them in one batch
+IMAGE_FORMATS = {
+    'pdf-to-png': 'png',
+    'pdf-to-jpeg': 'jpeg',
+    'pdf-to-jpg': 'jpeg',
+    'pdf-to-tiff': 'tiff',
+    'pdf-to-images': 'png',
+}
+
+# Output extension for each file of a --batch run; image conversions get a folder per input
+BATCH_EXTENSIONS = {
+    'pdf-to-word': '.docx',
+    'word-to-pdf': '.pdf',
+    'pdf-to-excel': '.xlsx',
+    'excel-to-pdf': '.pdf',
+    'html-to-pdf': '.pdf',
+    'ppt-to-pdf': '.pdf',
+    'pdf-to-html': '.html',
+    'pdf-to-ppt': '.pptx',
+    'pdf-to-png': '',
+    'pdf-to-jpeg': '',
+    'pdf-to-jpg': '',
+    'pdf-to-tiff': '',
+    'pdf-to-images': '',
+}
+
+def print_usage():
+    print("Usage: converter.exe <conversion_type> <input_file> <output_file> [--accurate-tables]")
+    print("       converter.exe <image_conversion> <input_glob> <output_folder>")
+    print("       converter.exe --batch <conversion_type> <input_glob> <output_folder>")
+    print("       converter.exe --serve   (jobs on stdin, one per line)")
+    print("\nAvailable conversions:")
+    for conv_type in CONVERSIONS.keys():
+        print(f"  - {conv_type}")
+
+def parse_options(conversion_type, flags):
+    """Conversion keyword arguments from command-line flags, or None after an unknown flag"""
+    # --accurate-tables: use pdfplumber's table finder in pdf-to-ppt
+    options = {}
+    for flag in flags:
+        if flag == '--accurate-tables' and conversion_type == 'pdf-to-ppt':
+            options['accurate_tables'] = True
+        else:
+            print(f"ERROR: Unknown option for {conversion_type}: {flag}")
+            return None
+    return options
+
+def init_batch_worker():
+    """--batch worker initializer: files already run in parallel, so pages don't"""
+    global IN_BATCH_WORKER
+    IN_BATCH_WORKER = True
+
+def run_batch_file(conversion_type, input_path, output_path, options):
+    """Convert one file of a --batch run"""
+    CONVERSIONS[conversion_type](input_path, output_path, **options)
+
+def run_batch(argv):
+    """
+    --batch: convert every file matching a glob into an output folder; returns the exit code
+    
+    Files are spread over one worker process per core; a single failed file is
+    reported and the rest still run.
+    """
+    import glob
+    
+    args = [arg for arg in argv if not arg.startswith('--')]
+    flags = [arg for arg in argv if arg.startswith('--')]
     
-    conversion_type = sys.argv[1].lower()
-    input_file = sys.argv[2]
-    output_file = sys.argv[3]
+    if len(args) != 3:
+        print_usage()
+        return 1
     
+    conversion_type = args[0].lower()
+    input_glob = args[1]
+    output_dir = args[2]
+    
+    if conversion_type not in CONVERSIONS:
+        print(f"ERROR: Unknown conversion type: {conversion_type}")
+        print(f"Available: {', '.join(CONVERSIONS.keys())}")
+        return 1
+    
+    options = parse_options(conversion_type, flags)
+    if options is None:
+        return 1
+    
+    input_files = sorted(glob.glob(input_glob))
+    if not input_files:
+        print(f"ERROR: No input files match: {input_glob}")
+        return 1
+    
+    os.makedirs(output_dir, exist_ok=True)
+    ext = BATCH_EXTENSIONS[conversion_type]
+    jobs = [(path, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ext))
+            for path in input_files]
+    
+    failed = 0
+    if len(jobs) < 4:
+        # Too few files to repay worker start-up
+        for input_path, output_path in jobs:
+            try:
+                run_batch_file(conversion_type, input_path, output_path, options)
+            except Exception as e:
+                print(f"ERROR: {input_path}: {str(e)}")
+                failed += 1
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_batch_worker) as executor:
+            futures = {executor.submit(run_batch_file, conversion_type, input_path, output_path, options): input_path
+                       for input_path, output_path in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"ERROR: {futures[future]}: {str(e)}")
+                    failed += 1
+                print(f"PROGRESS: {done}/{len(jobs)}", flush=True)
+    
+    if failed:
+        print(f"ERROR: {failed} of {len(jobs)} files failed")
+        return 1
+    print(f"SUCCESS: Converted {len(jobs)} files into {output_dir}")
+    return 0
+
+def run_job(argv):
+    """Run one conversion from its command-line arguments; returns the exit code"""
+    if argv[:1] == ['--batch']:
+        return run_batch(argv[1:])
+    
+    args = [arg for arg in argv if not arg.startswith('--')]
+    flags = [arg for arg in argv if arg.startswith('--')]
+    
+    if len(args) != 3:
+        print_usage()
+        return 1
+    
+    conversion_type = args[0].lower()
+    input_file = args[1]
+    output_file = args[2]
+    
+    options = parse_options(conversion_type, flags)
+    if options is None:
+        return 1
+    
+    # A glob input to an image conversion renders all matches in one batch;
+    # an existing file is always taken literally, brackets in its name or not
+    is_batch = (conversion_type in IMAGE_FORMATS and any(c in input_file for c in '*?[')
+                and not os.path.exists(input_file))
+    
+    if is_batch:
+        import glob
+        input_files = sorted(glob.glob(input_file))
+        if not input_files:
+            print(f"ERROR: No input files match: {input_file}")
+            return 1
     # Validate input file exists
-    if not os.path.exists(input_file):
+    elif not os.path.exists(input_file):
         print(f"ERROR: Input file not found: {input_file}")
-        sys.exit(1)
+        return 1
     
     # Get conversion function
     if conversion_type not in CONVERSIONS:
         print(f"ERROR: Unknown conversion type: {conversion_type}")
         print(f"Available: {', '.join(CONVERSIONS.keys())}")
-        sys.exit(1)
+        return 1
     
     try:
         # Run conversion
-        converter_func = CONVERSIONS[conversion_type]
-        converter_func(input_file, output_file)
-        sys.exit(0)
+        if is_batch:
+            image_format = IMAGE_FORMATS[conversion_type]
+            pdf_to_images_batch([(path, output_file, image_format, 150, 90) for path in input_files])
+        else:
+            converter_func = CONVERSIONS[conversion_type]
+            converter_func(input_file, output_file, **options)
+        return 0
     except Exception as e:
         print(f"ERROR: Conversion failed: {str(e)}")
         import traceback
         traceback.print_exc()
-        sys.exit(1)
+        return 1
+
+# Backends imported up front by --serve so no job pays their import cost
+SERVE_PRELOAD = ('fitz', 'pdfplumber', 'pdf2docx', 'docx', 'openpyxl', 'pptx', 'PIL.Image',
+                 'reportlab.platypus', 'reportlab.lib.styles', 'numpy')
+
+def serve():
+    """
+    --serve: read jobs from stdin, one per line, and run them in this process
+    
+    Each line holds the usual arguments, e.g. pdf-to-ppt "in file.pdf" out.pptx
+    (quotes group words; backslashes are kept as path separators). After each
+    job a line with OK or ERR is printed.
+    """
+    import importlib
+    import shlex
+    
+    for module_name in SERVE_PRELOAD:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass  # Only the conversions that need it will fail
+    
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            
+            lexer = shlex.shlex(line, posix=True)
+            lexer.whitespace_split = True
+            lexer.escape = ''
+            try:
+                job_args = list(lexer)
+            except ValueError as e:
+                print(f"ERROR: Could not parse job: {e}")
+                print("ERR", flush=True)
+                continue
+            
+            exit_code = run_job(job_args)
+            print("OK" if exit_code == 0 else "ERR", flush=True)
+    finally:
+        # Release the input PDFs still held by shared_pdf
+        close_shared_pdfs()
+
+def main():
+    if sys.argv[1:] == ['--serve']:
+        serve()
+        sys.exit(0)
+    
+    sys.exit(run_job(sys.argv[1:]))
 
 if __name__ == "__main__":
+    # Required for the pdf_to_ppt worker pool in the frozen executable;
+    # plain script runs skip the multiprocessing import
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()